@@ -0,0 +1,231 @@
+# app/core/compression.py
+from __future__ import annotations
+
+import asyncio
+import functools
+import gzip
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.utils.timed_cache import LoopCache
+
+try:  # optional: without it only gzip is offered
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment
+    brotli = None
+
+ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_COMPRESSIBLE = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+# compressed bodies of ETag'd GET responses (static files), keyed by
+# encoding + ETag + path, so each asset version is compressed once
+_STORED: LoopCache[bytes] = LoopCache(
+    ttl_seconds=24 * 3600,
+    name="compression.stored",
+    max_entries=settings.COMPRESSION_STORED_MAX_ENTRIES,
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Best encoding we can produce for an Accept-Encoding value, or None for
+    identity. Honours q-values; on a tie br wins over gzip.
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip()] = q
+    best, best_q = None, 0.0
+    for coding in ENCODINGS:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(media_type: Optional[str]) -> bool:
+    return bool(media_type) and media_type.startswith(_COMPRESSIBLE)
+
+
+def compress(body: bytes, encoding: str, *, cached: bool = False) -> bytes:
+    """One-shot compression. `cached` picks the stronger levels used for stored pages."""
+    if encoding == "br":
+        quality = settings.COMPRESSION_CACHED_BROTLI_QUALITY if cached else settings.COMPRESSION_BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = settings.COMPRESSION_CACHED_GZIP_LEVEL if cached else settings.COMPRESSION_GZIP_LEVEL
+    # mtime=0 keeps the output (and any ETag derived from it) stable
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _vary_on_encoding(raw: list[tuple[bytes, bytes]]) -> MutableHeaders:
+    headers = MutableHeaders(raw=raw)
+    if "accept-encoding" not in headers.get("vary", "").lower():
+        headers.add_vary_header("Accept-Encoding")
+    return headers
+
+
+def _mark_encoded(headers: MutableHeaders, encoding: str) -> None:
+    headers["Content-Encoding"] = encoding
+    # the compressed body is another representation and needs its own validator
+    etag = headers.get("etag")
+    if etag and etag.endswith('"'):
+        headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+
+
+def _stored_key(scope: Scope, headers: Headers, encoding: str) -> Optional[str]:
+    etag = headers.get("etag")
+    length = headers.get("content-length")
+    if scope["method"] != "GET" or not etag or not (length or "").isdigit():
+        return None
+    if int(length) > settings.COMPRESSION_STORED_MAX_SIZE:
+        return None
+    return f"{encoding}:{etag}:{scope['path']}"
+
+
+class _StreamCompressor:
+    # flushes after every chunk so streamed pages keep their flush points
+
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._gz = None
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        if self._br is not None:
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._gz.flush()
+
+
+class CompressionMiddleware:
+    """
+    br/gzip for text responses the client accepts it for.
+
+    Responses that already carry a Content-Encoding (pages served from the
+    page cache come precompressed) pass through untouched, as do range
+    requests and partial responses. Single-message bodies under
+    COMPRESSION_MIN_SIZE are sent as is; streamed bodies are compressed
+    chunk by chunk. GET responses with an ETag and a Content-Length (static
+    files) are compressed once at the cached levels and reused while the
+    ETag holds.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        if "range" in request_headers:
+            # ranges address bytes of the identity body; never compress a slice
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        start: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+        stored_key: Optional[str] = None
+        parts: list[bytes] = []
+
+        async def send_stored(body: bytes) -> None:
+            headers = _vary_on_encoding(start.setdefault("headers", []))
+            _mark_encoded(headers, encoding)
+            headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough, stored_key
+            kind = message["type"]
+            if kind == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                    "content-encoding" in headers
+                    or "content-range" in headers
+                    or message["status"] in (204, 206, 304)
+                    or not is_compressible(headers.get("content-type"))
+                ):
+                    passthrough = True
+                elif encoding is None:
+                    _vary_on_encoding(message.setdefault("headers", []))
+                    passthrough = True
+                else:
+                    start = message  # held until we see how big the body is
+                    stored_key = _stored_key(scope, headers, encoding)
+                    stored = _STORED.get(stored_key) if stored_key else None
+                    if stored is not None:
+                        await send_stored(stored)
+                        start = None  # the app's own body messages are dropped below
+                    return
+                await send(message)
+                return
+            if kind != "http.response.body" or passthrough:
+                await send(message)
+                return
+            if start is None and compressor is None:
+                return  # answered from _STORED
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            if stored_key is not None:
+                parts.append(body)
+                if more:
+                    return
+                body = b"".join(parts)
+                if len(body) >= settings.COMPRESSION_MIN_SIZE:
+                    loop = asyncio.get_running_loop()
+                    stored = await loop.run_in_executor(None, functools.partial(compress, body, encoding, cached=True))
+                    _STORED.set(stored_key, stored)
+                    passthrough = True
+                    await send_stored(stored)
+                    return
+                message = {"type": "http.response.body", "body": body}
+            if start is not None:
+                headers = _vary_on_encoding(start.setdefault("headers", []))
+                if not more and len(body) < settings.COMPRESSION_MIN_SIZE:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                _mark_encoded(headers, encoding)
+                if not more:
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                del headers["Content-Length"]
+                compressor = _StreamCompressor(encoding)
+                await send(start)
+                start = None
+
+            data = compressor.process(body) if body else b""
+            if not more:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more})
+
+        await self.app(scope, receive, send_compressed)
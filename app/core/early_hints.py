@@ -0,0 +1,89 @@
+# app/core/early_hints.py
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.core.site_resolver import resolve_site
+from app.core.templates import theme_asset_url
+
+# Assets every page pulls in from base.html. Keep in step with that file:
+# a preload only helps when its URL matches the tag's exactly.
+_STYLES = ("css/fonts.css", "css/tw.build.css")  # loaded with ?v=ASSETS_V
+_THEMED_STYLES = ("css/theme.css",)  # loaded through theme()
+_FONTS = ("fonts/Montserrat-Regular.ttf", "fonts/Montserrat-SemiBold.ttf", "fonts/Lato-Regular.ttf")
+_SCRIPTS = ("js/alpine.min.js", "js/htmx.min.js", "js/splide.min.js")
+
+_SKIP_PREFIXES = ("/static/", "/api/", "/internal/", "/healthz")
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else ""
+
+
+@lru_cache(maxsize=64)
+def page_links(slug: str, assets_v: str) -> tuple[bytes, ...]:
+    """Link header values (preconnect + preloads) for one theme's pages."""
+    links = []
+    media = _origin(settings.MEDIA_BASE_URL)
+    if media:
+        links.append(f"<{media}>; rel=preconnect")
+    links += [f"</static/{p}?v={assets_v}>; rel=preload; as=style" for p in _STYLES]
+    links += [f"<{theme_asset_url(slug, p)}>; rel=preload; as=style" for p in _THEMED_STYLES]
+    links += [f"<{theme_asset_url(slug, p)}>; rel=preload; as=font; type=\"font/ttf\"; crossorigin" for p in _FONTS]
+    links += [f"</static/{p}>; rel=preload; as=script" for p in _SCRIPTS]
+    return tuple(link.encode("latin-1") for link in links)
+
+
+def _wants_hints(scope: Scope) -> bool:
+    if scope["type"] != "http" or scope["method"] != "GET":
+        return False
+    if scope["path"].startswith(_SKIP_PREFIXES):
+        return False
+    headers = Headers(scope=scope)
+    if "hx-request" in headers:
+        return False
+    return "text/html" in headers.get("accept", "")
+
+
+class EarlyHintsMiddleware:
+    """
+    Tells the browser about render-blocking assets before the page is ready.
+
+    When the server implements the ASGI `http.response.early_hint` extension
+    it gets a 103 with the links up front; otherwise the links ride on the
+    HTML response as `Link` headers. Must be the outermost middleware:
+    the layers inside it only expect a response start and body, so this
+    resolves the site (and theme) itself.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not (settings.EARLY_HINTS and _wants_hints(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        site = resolve_site(Request(scope))
+        links = page_links(site.slug or "", settings.ASSETS_V or "1")
+
+        if "http.response.early_hint" in scope.get("extensions", {}):
+            await send({"type": "http.response.early_hint", "links": list(links)})
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_links(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if headers.get("content-type", "").startswith("text/html"):
+                    message["headers"] = [*message.get("headers", []), (b"link", b", ".join(links))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_links)
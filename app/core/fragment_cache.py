@@ -0,0 +1,93 @@
+# app/core/fragment_cache.py
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+from app.core.settings import settings
+from app.utils.interning import content_hash
+from app.utils.timed_cache import LoopCache
+
+FRAGMENT_CACHE_PREFIX = "fragment"
+
+_CACHES: Dict[str, LoopCache[str]] = {}
+
+
+def _fragment_cache(name: str, ttl: float) -> LoopCache[str]:
+    # one registered cache per fragment name; the first ttl seen wins
+    cache = _CACHES.get(name)
+    if cache is None:
+        cache = LoopCache(
+            ttl_seconds=float(ttl),
+            name=f"{FRAGMENT_CACHE_PREFIX}.{name}",
+            max_entries=settings.FRAGMENT_CACHE_MAX_ENTRIES,
+        )
+        _CACHES[name] = cache
+    return cache
+
+
+def fragment_key(ctx, vary: list[Any]) -> str | None:
+    """
+    Key for a fragment: theme, lang and host from the request, plus a content
+    fingerprint of the vary values. None when a value cannot be fingerprinted.
+    """
+    try:
+        version = content_hash(vary)
+    except TypeError:
+        return None
+    req = ctx.get("request")
+    state = getattr(req, "state", None)
+    slug = getattr(getattr(state, "site", None), "slug", None) or ""
+    lang = getattr(state, "lang", settings.DEFAULT_LANG)
+    # url_for() output embeds the host, so fragments are not shared across hosts
+    host = req.url.netloc if req is not None else ""
+    return f"{slug}:{lang}:{host}:{version:x}"
+
+
+class FragmentCacheExtension(Extension):
+    """
+    {% cache "name", ttl, value1, value2, ... %} ... {% endcache %}
+
+    Stores the rendered body per (theme, lang, host, contents of the listed
+    values) for `ttl` seconds. List every variable the body reads; when any of
+    them changes, the fingerprint changes and the body renders again.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        name = parser.parse_expression()
+        parser.stream.expect("comma")
+        ttl = parser.parse_expression()
+        vary = []
+        while parser.stream.skip_if("comma"):
+            vary.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        args = [nodes.ContextReference(), name, ttl, nodes.List(vary)]
+        return nodes.CallBlock(self.call_method("_render", args), [], [], body).set_lineno(lineno)
+
+    def _render(self, ctx, name: str, ttl: float, vary: list[Any], caller):
+        if not (settings.FRAGMENT_CACHE_ENABLED and ttl):
+            return caller()
+        key = fragment_key(ctx, vary)
+        if key is None:
+            return caller()
+        cache = _fragment_cache(name, ttl)
+        html = cache.get(key)
+        if html is not None:
+            return html
+        if self.environment.is_async:
+            return self._render_async(cache, key, caller)
+        html = caller()
+        cache.set(key, html)
+        return html
+
+    @staticmethod
+    async def _render_async(cache: LoopCache[str], key: str, caller) -> str:
+        # in async environments the block body is a coroutine function
+        html = await caller()
+        cache.set(key, html)
+        return html
@@ -0,0 +1,28 @@
+# app/core/internal_auth.py
+from __future__ import annotations
+
+from fastapi import HTTPException
+from starlette import status
+
+from app.core.settings import settings
+
+
+def check_internal_token(authorization: str | None, token_q: str | None) -> None:
+    """
+    Guard for the /internal endpoints: INTERNAL_CACHE_TOKEN as a bearer
+    token (or bare Authorization value), or as ?token=. 503 while no token
+    is configured, 401 on a mismatch.
+    """
+    expected = (settings.INTERNAL_CACHE_TOKEN or "").strip()
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="invalidation disabled")
+
+    provided = ""
+    if authorization:
+        parts = authorization.split(None, 1)
+        provided = parts[1].strip() if len(parts) == 2 and parts[0].lower() == "bearer" else authorization.strip()
+    if not provided and token_q:
+        provided = token_q.strip()
+
+    if provided != expected:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
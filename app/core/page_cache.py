@@ -0,0 +1,177 @@
+# app/core/page_cache.py
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, Optional
+
+from fastapi import Request
+from starlette.responses import Response, StreamingResponse
+
+from app.core.compression import compress, negotiate_encoding
+from app.core.settings import settings
+from app.utils.timed_cache import LoopCache
+
+PAGE_CACHE_PREFIX = "page"
+
+# query params every page accepts without creating a separate entry
+# (lang is already part of the key through request.state.lang)
+_IGNORED_PARAMS = frozenset({"lang"})
+
+
+@dataclass
+class CachedPage:
+    body: bytes
+    etag: str
+    media_type: str
+    status_code: int = 200
+    # content-coding -> (compressed body, etag), filled on first request for it
+    encoded: dict[str, tuple[bytes, str]] = field(default_factory=dict)
+
+    async def variant(self, encoding: Optional[str]) -> tuple[bytes, str]:
+        if encoding is None:
+            return self.body, self.etag
+        found = self.encoded.get(encoding)
+        if found is None:
+            # the cached levels (gzip 9, brotli 11) are too slow for the event loop
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(None, functools.partial(compress, self.body, encoding, cached=True))
+            found = self.encoded.setdefault(encoding, (body, f'{self.etag[:-1]}-{encoding}"'))
+        return found
+
+
+def _etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _find_request(args, kwargs) -> Optional[Request]:
+    for val in (*args, *kwargs.values()):
+        if isinstance(val, Request):
+            return val
+    return None
+
+
+def page_cache_key(req: Request, vary_query: Iterable[str]) -> Optional[str]:
+    """
+    Key for a cacheable request, or None when the query carries parameters
+    this page does not vary on (render those fresh instead of caching them).
+    """
+    allowed = set(vary_query)
+    parts = []
+    for k, v in sorted(req.query_params.multi_items()):
+        if k in _IGNORED_PARAMS:
+            continue
+        if k not in allowed:
+            return None
+        parts.append(f"{k}={v}")
+    site = getattr(req.state, "site", None)
+    sid = getattr(site, "id", None) or 0
+    slug = getattr(site, "slug", None) or ""
+    lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
+    # url_for() output embeds scheme and host, so pages are not shared across them
+    url = req.url
+    return f"{sid}:{slug}:{lang}:{url.scheme}://{url.netloc}{url.path}?{'&'.join(parts)}"
+
+
+def _negotiate(req: Request, page: CachedPage) -> Optional[str]:
+    if not settings.COMPRESSION_ENABLED or len(page.body) < settings.COMPRESSION_MIN_SIZE:
+        return None
+    return negotiate_encoding(req.headers.get("accept-encoding"))
+
+
+async def _respond(req: Request, page: CachedPage) -> Response:
+    encoding = _negotiate(req, page)
+    body, etag = await page.variant(encoding)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if settings.COMPRESSION_ENABLED:
+        headers["Vary"] = "Accept-Encoding"
+    if _etag_matches(req.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, status_code=page.status_code, media_type=page.media_type, headers=headers)
+
+
+async def _store_after_stream(
+    chunks: AsyncIterator[bytes | str], cache: LoopCache[CachedPage], key: str, media_type: str, charset: str,
+) -> AsyncIterator[bytes | str]:
+    # pass chunks through untouched; only a stream that ran to the end is stored
+    parts: list[bytes] = []
+    async for chunk in chunks:
+        parts.append(chunk if isinstance(chunk, bytes) else chunk.encode(charset))
+        yield chunk
+    body = b"".join(parts)
+    cache.set(key, CachedPage(body=body, etag=_etag_for(body), media_type=media_type))
+
+
+def cached_page(name: str, *, vary_query: Iterable[str] = (), ttl: Optional[float] = None):
+    """
+    Cache a GET route's rendered HTML per (site, lang, scheme, host, path,
+    normalized query).
+
+    Hits are served from memory with a strong ETag, and If-None-Match
+    revalidation gets a 304. Compressed variants are made once per entry
+    and encoding and kept on it, each with its own ETag. Only 200 responses are stored; a streamed
+    response is stored once it has been sent in full. Entries live in
+    the registered cache `page.<name>`, so invalidate_registered("page")
+    drops every page at once.
+    """
+    ttl = settings.PAGE_CACHE_TTL if ttl is None else ttl
+    vary = tuple(vary_query)
+    cache: LoopCache[CachedPage] = LoopCache(
+        ttl_seconds=ttl or 0.0,
+        name=f"{PAGE_CACHE_PREFIX}.{name}",
+        max_entries=settings.PAGE_CACHE_MAX_ENTRIES,
+    )
+
+    def decorator(fn):
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            req = _find_request(args, kwargs)
+            key = page_cache_key(req, vary) if (req is not None and ttl and req.method == "GET") else None
+            if key is None:
+                return await fn(*args, **kwargs)
+
+            page = cache.get(key)
+            if page is None:
+                response = await fn(*args, **kwargs)
+                if isinstance(response, StreamingResponse):
+                    if response.status_code == 200:
+                        response.body_iterator = _store_after_stream(
+                            response.body_iterator, cache, key,
+                            response.media_type or "text/html", response.charset,
+                        )
+                    return response
+                body = getattr(response, "body", None)
+                if response.status_code != 200 or not isinstance(body, bytes):
+                    return response
+                page = CachedPage(
+                    body=body,
+                    etag=_etag_for(body),
+                    media_type=response.media_type or "text/html",
+                    status_code=response.status_code,
+                )
+                cache.set(key, page)
+                fresh = await _respond(req, page)
+                # the render's own timings (template profiling) only exist on a miss
+                if "server-timing" in response.headers:
+                    fresh.headers["Server-Timing"] = response.headers["server-timing"]
+                return fresh
+            return await _respond(req, page)
+
+        return wrapper
+
+    return decorator
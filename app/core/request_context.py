@@ -0,0 +1,88 @@
+# app/core/request_context.py
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import parse_qsl
+
+from starlette.requests import cookie_parser
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+from app.core.site_resolver import host_from_headers, site_for
+
+LANG_COOKIE = "lang"
+
+# request headers the context is resolved from (ASGI names are lowercase)
+_HEADERS = frozenset({b"host", b"x-forwarded-host", b"forwarded", b"accept-language", b"cookie", b"x-site-slug", b"x-site-id"})
+
+
+def _normalize_lang(code: str | None) -> str:
+    if not code:
+        return settings.DEFAULT_LANG
+    code = code.lower().strip()
+    # allow zh-CN → zh etc.
+    code2 = code.split("-")[0]
+    return code2 if code2 in settings.SUPPORTED_LANGS else settings.DEFAULT_LANG
+
+
+@lru_cache(maxsize=16)
+def _lang_cookie_header(lang: str) -> tuple[bytes, bytes]:
+    # exactly what Response.set_cookie() would send
+    response = Response()
+    response.set_cookie(LANG_COOKIE, lang, max_age=60 * 60 * 24 * 365, samesite="lax")
+    return response.raw_headers[-1]
+
+
+class RequestContextMiddleware:
+    """
+    Sets request.state.site (host → site, see site_resolver) and
+    request.state.lang (?lang=, then the lang cookie, then the first
+    Accept-Language entry, then the site's default locale) from a single
+    pass over the request headers, and refreshes the lang cookie when it
+    is missing or differs.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        found: dict[bytes, str] = {}
+        for name, value in scope["headers"]:
+            # first occurrence wins, as with Headers.get()
+            if name in _HEADERS and name not in found:
+                found[name] = value.decode("latin-1")
+        qs = scope.get("query_string")
+        query = dict(parse_qsl(qs.decode("latin-1"), keep_blank_values=True)) if qs else {}
+        cookie = cookie_parser(found[b"cookie"]).get(LANG_COOKIE) if b"cookie" in found else None
+
+        host = host_from_headers(found.get(b"host"), found.get(b"x-forwarded-host"), found.get(b"forwarded"))
+        if scope["method"] == "GET":
+            site = site_for(
+                host,
+                query.get("__site") or found.get(b"x-site-slug"),
+                query.get("__site_id") or found.get(b"x-site-id"),
+            )
+        else:
+            site = site_for(host)
+        accept = (found.get(b"accept-language") or "").split(",")[0]
+        lang = _normalize_lang(query.get("lang") or cookie or accept or site.default_locale)
+
+        state = scope.setdefault("state", {})
+        state["site"] = site
+        state["lang"] = lang
+
+        if cookie == lang:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), _lang_cookie_header(lang)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -40,10 +40,69 @@ class Settings(BaseSettings):
 
     # Stage 3 host→site map: "host:slug:id,host2:slug2:id2"
     SITE_MAP_RAW: str = ""
+    # Stage 4: hosts from the site_domains/sites tables as well (SITE_MAP_RAW
+    # entries win per host), reloaded every SITE_INDEX_REFRESH seconds and on
+    # POST /internal/cache/invalidate?kind=sites
+    SITE_INDEX_FROM_DB: bool = True
+    SITE_INDEX_REFRESH: float = 300.0
     ALLOW_SITE_OVERRIDE: bool = Field(default=False, alias="SITE_ALLOW_OVERRIDE")
 
     INTERNAL_CACHE_TOKEN: str = ""
 
+    # Rendered-page cache (seconds; 0 disables) and its per-route entry cap
+    PAGE_CACHE_TTL: float = 10.0
+    PAGE_CACHE_MAX_ENTRIES: int = 512
+
+    # Rendered Markdown, keyed by a hash of the source text (LRU)
+    MARKDOWN_CACHE_MAX_ENTRIES: int = 1024
+    # Render plain paragraphs/bullets/headings without Python-Markdown
+    MARKDOWN_FAST_PATH: bool = True
+
+    # Composed /agenda data per (site, lang), seconds. Older than TTL it is
+    # still served while a background rebuild runs; past MAX_AGE the request
+    # waits for a fresh build. TTL 0 builds it on every request.
+    AGENDA_CACHE_TTL: float = 30.0
+    AGENDA_CACHE_MAX_AGE: float = 600.0
+    # Fetch the agenda with one whole-agenda request when the backend has it
+    AGENDA_WHOLE_FETCH: bool = True
+    # Load the agenda from DATABASE_URL instead of the backend API (falls back to it on errors)
+    AGENDA_DB_SOURCE: bool = False
+
+    # {% cache %} fragments in templates; entry cap applies per fragment name
+    FRAGMENT_CACHE_ENABLED: bool = True
+    FRAGMENT_CACHE_MAX_ENTRIES: int = 256
+
+    # Compiled-template cache shared by all workers; empty dir = Jinja's per-user temp dir
+    TEMPLATE_BYTECODE_CACHE: bool = True
+    TEMPLATE_BYTECODE_DIR: str = ""
+    # Compile constant t('...') keys into per-(theme, lang) template variants
+    TEMPLATE_INLINE_TRANSLATIONS: bool = True
+    # Stream pages that support it (home) while their data is still loading
+    TEMPLATE_STREAMING: bool = False
+    # Skip home-page fetches the theme's templates never read (see template_deps)
+    TEMPLATE_CONTEXT_PRUNING: bool = True
+    # Time every template, block and macro per render (Server-Timing header,
+    # totals at /internal/templates/profile). Adds overhead; off in production.
+    TEMPLATE_PROFILING: bool = False
+
+    # 103 Early Hints / Link preloads for the assets base.html loads
+    EARLY_HINTS: bool = True
+
+    # Response compression (br comes from the `brotli` package in requirements.txt;
+    # without it only gzip is offered).
+    # Live responses use the fast levels; cached pages are compressed once
+    # per entry at the stronger ones.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 500
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CACHED_GZIP_LEVEL: int = 9
+    COMPRESSION_CACHED_BROTLI_QUALITY: int = 11
+    # ETag'd responses (static files) up to this size are compressed once
+    # per ETag and encoding and kept
+    COMPRESSION_STORED_MAX_SIZE: int = 2 * 1024 * 1024
+    COMPRESSION_STORED_MAX_ENTRIES: int = 256
+
     _supported_langs_cache: Tuple[str, ...] | None = None
 
     @property
@@ -1,20 +1,24 @@
 # app/core/site_resolver.py
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.settings import settings
 
+log = logging.getLogger("app.site_resolver")
+
 
 @dataclass
 class SiteInfo:
     id: Optional[int]
     slug: Optional[str]
     host: Optional[str]
+    default_locale: Optional[str] = None
 
 
 def _parse_site_map(raw: str) -> dict[str, Tuple[str, int]]:
@@ -35,21 +39,108 @@ def _parse_site_map(raw: str) -> dict[str, Tuple[str, int]]:
     return out
 
 
-_SITE_MAP_CACHE: tuple[str, dict[str, Tuple[str, int]]] = ("", {})
+@dataclass(frozen=True)
+class SiteIndex:
+    """Hashed lookups for resolving sites: host -> (slug, id), slug -> id, id -> default locale."""
+
+    hosts: dict[str, Tuple[str, int]]
+    slugs: dict[str, int]
+    locales: dict[int, str]
+
+
+_EMPTY_INDEX = SiteIndex(hosts={}, slugs={}, locales={})
 
+# loaded from site_domains/sites; replaced as a whole on every refresh
+_db_index: SiteIndex = _EMPTY_INDEX
+_SITE_INDEX_CACHE: tuple[str, SiteIndex, SiteIndex] = ("", _EMPTY_INDEX, _EMPTY_INDEX)
 
-def _current_site_map() -> dict[str, Tuple[str, int]]:
+
+def _current_index() -> SiteIndex:
+    """The database index with SITE_MAP_RAW entries on top (they win per host)."""
     raw = settings.SITE_MAP_RAW or ""
-    cached_raw, cached_map = _SITE_MAP_CACHE
-    if raw == cached_raw:
-        return cached_map
-    parsed = _parse_site_map(raw)
-    globals()["_SITE_MAP_CACHE"] = (raw, parsed)
-    return parsed
+    cached_raw, cached_db, cached = _SITE_INDEX_CACHE
+    if raw == cached_raw and cached_db is _db_index:
+        return cached
+    db = _db_index
+    hosts = {**db.hosts, **_parse_site_map(raw)}
+    slugs = dict(db.slugs)
+    for slug, sid in hosts.values():
+        slugs.setdefault(slug, sid)
+    index = SiteIndex(hosts=hosts, slugs=slugs, locales=db.locales)
+    globals()["_SITE_INDEX_CACHE"] = (raw, db, index)
+    return index
 
 
-def _request_host(request: Request) -> str:
-    fwd = request.headers.get("x-forwarded-host") or request.headers.get("forwarded")
+def _domain_key(domain: str) -> str:
+    return (domain or "").strip().split(":")[0].lower()
+
+
+def load_site_index() -> SiteIndex:
+    """Active sites and their domains from the database, in two queries."""
+    from sqlalchemy import select
+
+    from app.core.db import db_context
+    from app.models.site_model import Site, SiteDomain
+
+    with db_context() as db:
+        sites = db.execute(select(Site.id, Site.slug, Site.is_active, Site.default_locale)).all()
+        domains = db.execute(select(SiteDomain.domain, SiteDomain.site_id)).all()
+
+    active = {row.id: row for row in sites if row.is_active and row.slug}
+    hosts = {}
+    for domain, site_id in domains:
+        site = active.get(site_id)
+        key = _domain_key(domain)
+        if site is not None and key:
+            hosts[key] = (site.slug, site.id)
+    return SiteIndex(
+        hosts=hosts,
+        slugs={site.slug: sid for sid, site in active.items()},
+        locales={sid: site.default_locale for sid, site in active.items() if site.default_locale},
+    )
+
+
+async def refresh_site_index() -> bool:
+    """Reload the database index; on failure the previous one stays in use."""
+    global _db_index
+    loop = asyncio.get_running_loop()
+    try:
+        _db_index = await loop.run_in_executor(None, load_site_index)
+    except Exception as e:
+        log.warning("site index refresh failed, keeping %d hosts: %r", len(_db_index.hosts), e)
+        return False
+    log.info("site index: %d hosts, %d sites", len(_db_index.hosts), len(_db_index.slugs))
+    return True
+
+
+_refresh_requested: Optional[asyncio.Event] = None
+
+
+def invalidate_site_index() -> None:
+    """Ask keep_site_index_fresh() to reload now instead of at its next interval."""
+    if _refresh_requested is not None:
+        _refresh_requested.set()
+
+
+async def keep_site_index_fresh(interval: float) -> None:
+    global _refresh_requested
+    _refresh_requested = asyncio.Event()
+    while True:
+        try:
+            await asyncio.wait_for(_refresh_requested.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        _refresh_requested.clear()
+        await refresh_site_index()
+
+
+def site_index_stats() -> dict:
+    index = _current_index()
+    return {"hosts": len(index.hosts), "sites": len(index.slugs), "from_database": len(_db_index.hosts)}
+
+
+def host_from_headers(host: str | None, forwarded_host: str | None, forwarded: str | None) -> str:
+    fwd = forwarded_host or forwarded
     if fwd and "host=" in fwd.lower():
         # Forwarded: host=example.com;proto=https
         try:
@@ -59,42 +150,53 @@ def _request_host(request: Request) -> str:
                     return p.split("=", 1)[1].strip().split(",")[0].split(":")[0].lower()
         except Exception:
             pass
-    if request.headers.get("x-forwarded-host"):
-        return request.headers["x-forwarded-host"].split(",")[0].split(":")[0].lower()
-    h = (request.headers.get("host") or "").split(":")[0].strip().lower()
-    return h
+    if forwarded_host:
+        return forwarded_host.split(",")[0].split(":")[0].lower()
+    return (host or "").split(":")[0].strip().lower()
 
 
-class SiteResolverMiddleware(BaseHTTPMiddleware):
+def _request_host(request: Request) -> str:
+    headers = request.headers
+    return host_from_headers(headers.get("host"), headers.get("x-forwarded-host"), headers.get("forwarded"))
+
 
-    async def dispatch(self, request: Request, call_next):
-        host = _request_host(request)
-        site_map = _current_site_map()
+def site_for(host: str, override_slug: str | None = None, override_id: str | None = None) -> SiteInfo:
+    """
+    The site for a request host. `override_slug`/`override_id` (from
+    ?__site=/?__site_id= or X-Site-Slug/X-Site-Id) are only honoured when
+    ALLOW_SITE_OVERRIDE is on; callers pass them for GET requests only.
+    """
+    index = _current_index()
 
-        slug, sid = None, None
-        if host in site_map:
-            slug, sid = site_map[host]
+    slug, sid = None, None
+    if host in index.hosts:
+        slug, sid = index.hosts[host]
 
-        if settings.ALLOW_SITE_OVERRIDE and request.method == "GET":
-            qp = request.query_params
-            override_slug = qp.get("__site") or request.headers.get("x-site-slug")
-            override_id = qp.get("__site_id") or request.headers.get("x-site-id")
+    if settings.ALLOW_SITE_OVERRIDE:
+        if override_slug:
+            override_slug = override_slug.strip()
             if override_slug:
-                override_slug = override_slug.strip()
-                if override_slug:
-                    slug = override_slug
-                    if not sid:
-                        for _host, (s_slug, s_id) in site_map.items():
-                            if s_slug == slug:
-                                sid = s_id
-                                break
-            if override_id:
-                try:
-                    sid_val = int(str(override_id).strip())
-                    if sid_val > 0:
-                        sid = sid_val
-                except Exception:
-                    pass
-
-        request.state.site = SiteInfo(id=sid, slug=slug, host=host)
-        return await call_next(request)
+                slug = override_slug
+                if not sid:
+                    sid = index.slugs.get(slug)
+        if override_id:
+            try:
+                sid_val = int(str(override_id).strip())
+                if sid_val > 0:
+                    sid = sid_val
+            except Exception:
+                pass
+
+    return SiteInfo(id=sid, slug=slug, host=host, default_locale=index.locales.get(sid))
+
+
+def resolve_site(request: Request) -> SiteInfo:
+    host = _request_host(request)
+    if request.method != "GET":
+        return site_for(host)
+    qp = request.query_params
+    return site_for(
+        host,
+        qp.get("__site") or request.headers.get("x-site-slug"),
+        qp.get("__site_id") or request.headers.get("x-site-id"),
+    )
@@ -0,0 +1,84 @@
+# app/core/template_deps.py
+from __future__ import annotations
+
+import logging
+import os
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from jinja2 import Environment, meta
+
+from app.core.settings import settings
+from app.core.templates import _theme_dir, _theme_slugs, theme_env
+
+# (theme, template name) -> (context names it reads, (filename, mtime) of every file read)
+_NAMES: Dict[tuple[str, str], tuple[Optional[FrozenSet[str]], tuple]] = {}
+
+
+def _scan(env: Environment, name: str) -> tuple[Optional[FrozenSet[str]], tuple]:
+    # walk every template reachable through include/import/extends from `name`
+    seen: set[str] = set()
+    todo = [name]
+    names: set[str] = set()
+    files = []
+    dynamic = False
+    while todo:
+        current = todo.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source, filename, _ = env.loader.get_source(env, current)
+        if filename:
+            files.append((filename, os.stat(filename).st_mtime_ns))
+        ast = env.parse(source, current, filename)
+        names |= meta.find_undeclared_variables(ast)
+        for ref in meta.find_referenced_templates(ast):
+            if ref is None:
+                dynamic = True  # computed at render time: anything could be read
+            else:
+                todo.append(ref)
+    return (None if dynamic else frozenset(names)), tuple(files)
+
+
+def _stale(files: tuple) -> bool:
+    try:
+        return any(os.stat(f).st_mtime_ns != mtime for f, mtime in files)
+    except OSError:
+        return True
+
+
+def context_names(slug: str | None, name: str) -> Optional[FrozenSet[str]]:
+    """
+    Context variables that rendering `name` for a theme can read, across
+    every template it includes, imports or extends. None when that is not
+    known (a template name computed at render time, a template that fails
+    to parse, or TEMPLATE_CONTEXT_PRUNING off): callers then fill in the
+    full context. In dev the result is recomputed when a file it came
+    from changes.
+    """
+    if not settings.TEMPLATE_CONTEXT_PRUNING:
+        return None
+    key = (_theme_dir(slug), name)
+    entry = _NAMES.get(key)
+    if entry is None or (settings.ENV == "dev" and _stale(entry[1])):
+        try:
+            entry = _scan(theme_env(slug), name)
+        except Exception as exc:
+            logging.getLogger("core.template_deps").warning("dependency scan of %s failed: %r", name, exc)
+            entry = (None, ())
+        _NAMES[key] = entry
+    return entry[0]
+
+
+def wants(names: Optional[FrozenSet[str]], *keys: str) -> bool:
+    """True when any of `keys` may be read (always, when names are unknown)."""
+    return names is None or not names.isdisjoint(keys)
+
+
+def analyze_templates(pages: Iterable[str]) -> int:
+    """Scan `pages` for every theme up front; returns how many scans were made."""
+    count = 0
+    for slug in _theme_slugs():
+        for page in pages:
+            context_names(slug, page)
+            count += 1
+    return count
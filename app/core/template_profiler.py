@@ -0,0 +1,169 @@
+# app/core/template_profiler.py
+from __future__ import annotations
+
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from jinja2 import Template
+from jinja2.runtime import Macro
+
+# how many entries the Server-Timing header carries (largest self time first)
+SERVER_TIMING_LIMIT = 20
+
+
+class RenderProfile:
+    """
+    Timings for one render, per template root (the page, each include and
+    each extended parent), block and macro. `self` time excludes nested
+    entries, so self times add up to the whole render.
+    """
+
+    __slots__ = ("entries", "_stack")
+
+    def __init__(self) -> None:
+        # label -> [calls, self seconds, total seconds]
+        self.entries: Dict[str, list] = {}
+        self._stack: list[list] = []
+
+    def count(self, label: str) -> None:
+        entry = self.entries.get(label)
+        if entry is None:
+            entry = self.entries[label] = [0, 0.0, 0.0]
+        entry[0] += 1
+
+    def enter(self, label: str) -> None:
+        self._stack.append([label, perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        label, started, nested = self._stack.pop()
+        took = perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += took
+        entry = self.entries.get(label)
+        if entry is None:
+            entry = self.entries[label] = [0, 0.0, 0.0]
+        entry[1] += took - nested
+        entry[2] += took
+
+    def server_timing(self) -> str:
+        top = sorted(self.entries.items(), key=lambda kv: kv[1][1], reverse=True)[:SERVER_TIMING_LIMIT]
+        total = sum(e[1] for e in self.entries.values())
+        parts = [f'tpl;desc="render";dur={total * 1000:.2f}']
+        parts += [f'tpl{i};desc="{label}";dur={e[1] * 1000:.2f}' for i, (label, e) in enumerate(top)]
+        return ", ".join(parts)
+
+
+_active: ContextVar[Optional[RenderProfile]] = ContextVar("_active_render_profile", default=None)
+
+# label -> [renders, calls, self seconds, total seconds, max self seconds per render]
+_TOTALS: Dict[str, list] = {}
+
+
+def start_profile() -> tuple[RenderProfile, Any]:
+    """Start collecting for the current render; pass the result to finish_profile()."""
+    profile = RenderProfile()
+    return profile, _active.set(profile)
+
+
+def finish_profile(profile: RenderProfile, token: Any) -> None:
+    _active.reset(token)
+    for label, (calls, own, total) in profile.entries.items():
+        agg = _TOTALS.get(label)
+        if agg is None:
+            agg = _TOTALS[label] = [0, 0, 0.0, 0.0, 0.0]
+        agg[0] += 1
+        agg[1] += calls
+        agg[2] += own
+        agg[3] += total
+        agg[4] = max(agg[4], own)
+
+
+def profile_stats() -> dict:
+    """Totals across profiled renders since start (or the last reset), slowest first."""
+    rows = [
+        {
+            "label": label,
+            "renders": renders,
+            "calls": calls,
+            "self_ms": round(own * 1000, 3),
+            "total_ms": round(total * 1000, 3),
+            "avg_self_ms": round(own * 1000 / renders, 3),
+            "max_self_ms": round(peak * 1000, 3),
+        }
+        for label, (renders, calls, own, total, peak) in _TOTALS.items()
+    ]
+    rows.sort(key=lambda r: r["self_ms"], reverse=True)
+    return {"entries": rows, "templates": len(rows)}
+
+
+def reset_profile_stats() -> None:
+    _TOTALS.clear()
+
+
+def _timed_render(label: str, func: Callable[..., Iterator[str]]) -> Callable[..., Iterator[str]]:
+    # render functions are generators: time each step, count the call once
+    def render(*args: Any) -> Iterator[str]:
+        profile = _active.get()
+        if profile is None:
+            yield from func(*args)
+            return
+        profile.count(label)
+        gen = func(*args)
+        while True:
+            profile.enter(label)
+            try:
+                chunk = next(gen)
+            except StopIteration:
+                return
+            finally:
+                profile.exit()
+            yield chunk
+
+    return render
+
+
+def _timed_macro_class(template_name: str) -> type:
+    class TimedMacro(Macro):
+        def _invoke(self, arguments: list, autoescape: bool) -> str:
+            profile = _active.get()
+            if profile is None:
+                return super()._invoke(arguments, autoescape)
+            label = f"{template_name} [macro {self.name or 'caller'}]"
+            profile.count(label)
+            profile.enter(label)
+            try:
+                return super()._invoke(arguments, autoescape)
+            finally:
+                profile.exit()
+
+    return TimedMacro
+
+
+def _label(template: Template) -> str:
+    # theme overrides share their plain name with the base file; keep them apart
+    parts = Path(template.filename or "").parts
+    if "_themes" in parts:
+        return "/".join(parts[parts.index("_themes"):])
+    return template.name or "<string>"
+
+
+class ProfiledTemplate(Template):
+    """
+    Template whose root, block and macro render functions report to the
+    request's RenderProfile while one is active. Async (streamed) templates
+    are left as they are: their render steps include waiting for data.
+    """
+
+    @classmethod
+    def _from_namespace(cls, environment, namespace, globals):
+        t = super()._from_namespace(environment, namespace, globals)
+        if environment.is_async:
+            return t
+        name = _label(t)
+        t.root_render_func = _timed_render(name, t.root_render_func)
+        t.blocks = {block: _timed_render(f"{name} [block {block}]", fn) for block, fn in t.blocks.items()}
+        # the compiled module looks Macro up in its namespace when a macro is defined
+        namespace["Macro"] = _timed_macro_class(name)
+        return t
@@ -1,16 +1,27 @@
 # app/core/templates.py
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import time
+from contextvars import ContextVar
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Mapping
 
-from jinja2 import pass_context
+from jinja2 import (ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, Template, pass_context,
+                    pass_environment)
+from markupsafe import Markup
 from starlette.requests import Request
+from starlette.responses import StreamingResponse
 from starlette.templating import Jinja2Templates
 
+from app.core.fragment_cache import FragmentCacheExtension
 from app.core.settings import settings
+from app.core.template_profiler import ProfiledTemplate, finish_profile, start_profile
+from app.core.translation_inline import TranslationInlineExtension
 
 _BASE_DIR = Path(__file__).parent.parent
 _LOCALES_DIR = _BASE_DIR / "locales"
@@ -43,24 +54,76 @@ def _load_theme_locale(slug: str | None, lang: str) -> Dict[str, str]:
         return {}
 
 
-@lru_cache(maxsize=512)
-def _resolve_themed_path(slug: str | None, path: str) -> str | None:
-    p = path.lstrip("/")
-    if not slug:
-        return None
-    candidate = _THEME_TEMPLATES_DIR / slug / p
-    if candidate.exists():
-        return f"_themes/{slug}/{p}"
-    return None
+# (theme slug, lang) -> merged, read-only table; see translations_for()
+_TABLES: Dict[tuple[str, str], Mapping[str, str]] = {}
+_locale_signature: tuple = ()
+
+
+def _locale_files() -> tuple:
+    files = list(_LOCALES_DIR.glob("*.json")) + list(_THEME_TEMPLATES_DIR.glob("*/locales/*.json"))
+    out = []
+    for f in sorted(files):
+        try:
+            out.append((str(f), f.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(out)
+
+
+def _reload_if_changed() -> None:
+    global _locale_signature
+    sig = _locale_files()
+    if sig != _locale_signature:
+        _locale_signature = sig
+        _load_locale.cache_clear()
+        _load_theme_locale.cache_clear()
+        _TABLES.clear()
+
+
+def _merge_table(slug: str, lang: str) -> Mapping[str, str]:
+    # lowest precedence first; empty values never override (t() falls through them)
+    layers = [_load_locale(settings.DEFAULT_LANG), _load_locale(lang)]
+    if slug:
+        layers += [_load_theme_locale(slug, settings.DEFAULT_LANG), _load_theme_locale(slug, lang)]
+    merged: Dict[str, str] = {}
+    for layer in layers:
+        merged.update((k, v) for k, v in layer.items() if v)
+    return MappingProxyType(merged)
+
+
+def translations_for(slug: str | None, lang: str) -> Mapping[str, str]:
+    """
+    One frozen table per (theme, lang) with the theme-lang, theme-default,
+    global-lang, global-default fallback chain already applied. In dev the
+    tables are rebuilt when any locale file changes.
+    """
+    if settings.ENV == "dev":
+        _reload_if_changed()
+    key = (slug or "", lang)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = _merge_table(key[0], lang)
+    return table
+
+
+def _theme_slugs() -> list[str]:
+    return [""] + sorted(p.name for p in _THEME_TEMPLATES_DIR.iterdir() if p.is_dir())
+
+
+def build_translation_tables() -> int:
+    """Build every (theme, supported lang) table up front; returns how many."""
+    for slug in _theme_slugs():
+        for lang in settings.SUPPORTED_LANGS:
+            translations_for(slug, lang)
+    return len(_TABLES)
 
 
-def themed_name(req: Request | None, path: str) -> str:
-    slug = None
-    if req is not None:
-        site = getattr(req.state, "site", None)
-        slug = getattr(site, "slug", None)
-    resolved = _resolve_themed_path(slug, path)
-    return resolved or path.lstrip("/")
+@lru_cache(maxsize=64)
+def _theme_dir(slug: str | None) -> str:
+    # sites without their own templates render with the base environment
+    if slug and (_THEME_TEMPLATES_DIR / slug).is_dir():
+        return slug
+    return ""
 
 
 @lru_cache(maxsize=256)
@@ -82,9 +145,7 @@ def site_slug(ctx) -> str:
     return getattr(s, "slug", "") or ""
 
 
-@pass_context
-def theme(ctx, path: str) -> str:
-    slug = site_slug(ctx)
+def theme_asset_url(slug: str | None, path: str) -> str:
     rel = path.lstrip("/")
     themed_asset = _resolve_theme_asset(slug, rel)
     if themed_asset:
@@ -93,9 +154,8 @@ def theme(ctx, path: str) -> str:
 
 
 @pass_context
-def themed(ctx, path: str) -> str:
-    req = ctx.get("request")
-    return themed_name(req, path)
+def theme(ctx, path: str) -> str:
+    return theme_asset_url(site_slug(ctx), path)
 
 
 @pass_context
@@ -106,27 +166,16 @@ def is_site(ctx, slug: str) -> bool:
 @pass_context
 def t(ctx, key: str) -> str:
     req = ctx.get("request")
-    lang = getattr(getattr(req, "state", None), "lang", settings.DEFAULT_LANG)
-    slug = site_slug(ctx)
-
-    # 1) Theme override (lang → default EN)
-    if slug:
-        td = _load_theme_locale(slug, lang)
-        if key in td and td[key]:
-            return td[key]
-        t_en = _load_theme_locale(slug, settings.DEFAULT_LANG)
-        if key in t_en and t_en[key]:
-            return t_en[key]
-
-    # 2) Global (lang → default EN)
-    d_lang = _load_locale(lang)
-    if key in d_lang and d_lang[key]:
-        return d_lang[key]
-    d_en = _load_locale(settings.DEFAULT_LANG)
-    if key in d_en and d_en[key]:
-        return d_en[key]
-
-    return key
+    state = getattr(req, "state", None)
+    # the request's table is resolved once and kept on request.state
+    table = getattr(state, "t_table", None)
+    if table is None:
+        lang = getattr(state, "lang", settings.DEFAULT_LANG)
+        slug = getattr(getattr(state, "site", None), "slug", None)
+        table = translations_for(slug, lang)
+        if state is not None:
+            state.t_table = table
+    return table.get(key, key)
 
 
 @pass_context
@@ -135,11 +184,253 @@ def lang_ctx(ctx) -> str:
     return getattr(getattr(req, "state", None), "lang", settings.DEFAULT_LANG)
 
 
-templates = Jinja2Templates(directory="app/templates", auto_reload=settings.ENV == "dev")
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    if not settings.TEMPLATE_BYTECODE_CACHE:
+        return None
+    directory = settings.TEMPLATE_BYTECODE_DIR or None
+    if directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
+# theme slug -> environment that looks in _themes/<slug>/ before the base templates
+_THEME_ENVS: Dict[str, Environment] = {}
+# (theme, merged-table digest) -> environment with that table's constant t() keys compiled in
+_SPECIALIZED_ENVS: Dict[tuple[str, str], Environment] = {}
+# (site slug, lang) -> (table the env was built from, digest, env)
+_ENV_FOR: Dict[tuple[str, str], tuple[Mapping[str, str], str, Environment]] = {}
+# (theme, digest) ("" digest for an unspecialised env) -> async twin used for streamed pages
+_STREAMING_ENVS: Dict[tuple[str, str], Environment] = {}
+
+
+def _table_digest(table: Mapping[str, str]) -> str:
+    raw = json.dumps(sorted(table.items()), ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _overlay(env: Environment, tag: str, **options: Any) -> Environment:
+    bcc = env.bytecode_cache
+    if isinstance(bcc, FileSystemBytecodeCache):
+        # compiled code differs per variant, so variants must not share cache files
+        bcc = FileSystemBytecodeCache(bcc.directory, pattern=f"__jinja2_{tag}_%s.cache")
+    return env.overlay(cache_size=getattr(env.cache, "capacity", 400), bytecode_cache=bcc, **options)
+
+
+def theme_env(slug: str | None) -> Environment:
+    """
+    Environment for one theme. Its ChoiceLoader tries _themes/<slug>/ before
+    the base templates, so templates refer to each other by plain name and
+    a theme's overrides are picked up by the loader, not at render time.
+    Each theme keeps its own compiled templates.
+    """
+    theme = _theme_dir(slug)
+    if not theme:
+        return templates.env
+    env = _THEME_ENVS.get(theme)
+    if env is None:
+        loader = ChoiceLoader([FileSystemLoader(_THEME_TEMPLATES_DIR / theme), templates.env.loader])
+        # compiled code does not depend on the loader, so the bytecode cache is shared
+        env = _THEME_ENVS[theme] = templates.env.overlay(
+            loader=loader, cache_size=getattr(templates.env.cache, "capacity", 400),
+        )
+    return env
+
+
+def _variant(slug: str | None, lang: str) -> tuple[str, Environment]:
+    if not settings.TEMPLATE_INLINE_TRANSLATIONS:
+        return "", theme_env(slug)
+    key = (slug or "", lang)
+    table = translations_for(slug, lang)
+    entry = _ENV_FOR.get(key)
+    if entry is not None and entry[0] is table:
+        return entry[1], entry[2]
+    digest = _table_digest(table)
+    theme = _theme_dir(slug)
+    env = _SPECIALIZED_ENVS.get((theme, digest))
+    if env is None:
+        env = _SPECIALIZED_ENVS[(theme, digest)] = _overlay(theme_env(slug), digest)
+        env.inline_translations = table
+    _ENV_FOR[key] = (table, digest, env)
+    if entry is not None and entry[1] != digest:
+        _drop_variant(theme, entry[1])
+    return digest, env
+
+
+def _drop_variant(theme: str, digest: str) -> None:
+    # a changed table leaves its old variant behind; drop it once no (site, lang) renders with it
+    if any(d == digest and _theme_dir(slug) == theme for (slug, _), (_, d, _) in _ENV_FOR.items()):
+        return
+    _SPECIALIZED_ENVS.pop((theme, digest), None)
+    _STREAMING_ENVS.pop((theme, digest), None)
+
+
+def specialized_env(slug: str | None, lang: str) -> Environment:
+    """
+    Environment for rendering one (theme, lang): theme_env() with the
+    table's constant t() keys compiled in. Variants built from the same
+    table share bytecode files. A dev-mode locale change produces a new
+    table and a fresh environment.
+    """
+    return _variant(slug, lang)[1]
+
+
+def streaming_env(slug: str | None, lang: str) -> Environment:
+    """Async twin of specialized_env(), for generate_async() renders."""
+    digest, env = _variant(slug, lang)
+    key = (_theme_dir(slug), digest)
+    aenv = _STREAMING_ENVS.get(key)
+    if aenv is None:
+        aenv = _STREAMING_ENVS[key] = _overlay(env, f"{digest}_async" if digest else "async", enable_async=True)
+    return aenv
+
+
+# emitted by flush() in streamed renders; never reaches the client
+_FLUSH_MARK = "\x00flush\x00"
+
+
+def ready(value: Any) -> Any:
+    """
+    Resolve a context value that may still be loading. Streamed renders pass
+    tasks in the context, and async templates await whatever a call returns,
+    so `{% set x = ready(x) %}` waits there for x. In ordinary renders the
+    value is already there and comes back unchanged.
+    """
+    return value
+
+
+@pass_environment
+def flush(env) -> str:
+    """In a streamed render, send everything rendered so far; elsewhere a no-op."""
+    return Markup(_FLUSH_MARK) if env.is_async else ""
+
+
+async def _flushed_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    # Jinja yields one chunk per output node; send them in batches at flush() points
+    buf: list[str] = []
+    async for chunk in chunks:
+        if _FLUSH_MARK not in chunk:
+            buf.append(chunk)
+            continue
+        head, *rest = chunk.split(_FLUSH_MARK)
+        buf.append(head)
+        for part in rest:
+            out = "".join(buf)
+            if out:
+                yield out
+            buf = [part]
+    out = "".join(buf)
+    if out:
+        yield out
+
+
+def _request_of(args: tuple, kwargs: Dict[str, Any]) -> Request | None:
+    # both TemplateResponse call styles: (request, name, ...) and (name, {"request": ...}, ...)
+    if args and not isinstance(args[0], str):
+        return args[0]
+    context = args[1] if len(args) > 1 else kwargs.get("context", {})
+    return kwargs.get("request") or context.get("request")
+
+
+_render_env: ContextVar[Environment | None] = ContextVar("_render_env", default=None)
+
+
+class ThemedTemplates(Jinja2Templates):
+    """
+    Jinja2Templates that renders each request with its theme's environment,
+    specialised for its lang; see theme_env() and specialized_env().
+    Routes pass plain template names. With TEMPLATE_PROFILING on, each
+    render's per-template breakdown goes out as a Server-Timing header.
+    """
+
+    def TemplateResponse(self, *args: Any, **kwargs: Any):
+        req = _request_of(args, kwargs)
+        state = getattr(req, "state", None)
+        slug = getattr(getattr(state, "site", None), "slug", None)
+        lang = getattr(state, "lang", settings.DEFAULT_LANG)
+        token = _render_env.set(specialized_env(slug, lang))
+        profiling = start_profile() if settings.TEMPLATE_PROFILING else None
+        try:
+            response = super().TemplateResponse(*args, **kwargs)
+        finally:
+            _render_env.reset(token)
+            if profiling is not None:
+                finish_profile(*profiling)
+        if profiling is not None:
+            response.headers.append("Server-Timing", profiling[0].server_timing())
+        return response
+
+    def get_template(self, name: str) -> Template:
+        return (_render_env.get() or self.env).get_template(name)
+
+    def StreamingTemplateResponse(self, name: str, context: Dict[str, Any], status_code: int = 200) -> StreamingResponse:
+        """
+        Render `name` with generate_async() and send it as it is produced.
+        Context values may be tasks; templates wait for them with ready()
+        and mark send points with flush().
+        """
+        req = context["request"]
+        state = getattr(req, "state", None)
+        slug = getattr(getattr(state, "site", None), "slug", None)
+        lang = getattr(state, "lang", settings.DEFAULT_LANG)
+        template = streaming_env(slug, lang).get_template(name)
+        return StreamingResponse(
+            _flushed_chunks(template.generate_async(context)),
+            status_code=status_code,
+            media_type="text/html",
+        )
+
+
+def precompile_templates() -> int:
+    """
+    Compile every template up front so no request pays for it, once per
+    specialised environment (under plain names, which that theme's loader
+    resolves to its overrides).
+    Fills the template caches and writes the bytecode cache.
+    Returns how many templates compiled; failures are logged and skipped.
+    """
+    log = logging.getLogger("core.templates")
+    started = time.perf_counter()
+    all_names = templates.env.list_templates(extensions=["html"])
+    targets: Dict[int, tuple[Environment, set[str]]] = {}
+    for slug in _theme_slugs():
+        own = f"_themes/{slug}/"
+        plain = {n.removeprefix(own) for n in all_names if not n.startswith("_themes/") or n.startswith(own)}
+        for lang in settings.SUPPORTED_LANGS:
+            envs = [specialized_env(slug, lang)]
+            if settings.TEMPLATE_STREAMING:
+                envs.append(streaming_env(slug, lang))
+            for env in envs:
+                targets.setdefault(id(env), (env, set()))[1].update(plain)
+    compiled = 0
+    for env, names in targets.values():
+        for name in sorted(names):
+            try:
+                env.get_template(name)
+                compiled += 1
+            except Exception as exc:
+                log.warning("precompile %s failed: %r", name, exc)
+    log.info(
+        "precompiled %d templates for %d environments in %.0f ms",
+        compiled, len(targets), (time.perf_counter() - started) * 1000,
+    )
+    return compiled
+
+
+templates = ThemedTemplates(
+    directory="app/templates",
+    auto_reload=settings.ENV == "dev",
+    bytecode_cache=_bytecode_cache(),
+)
+if settings.TEMPLATE_PROFILING:
+    # before any template loads: every environment is an overlay of this one
+    templates.env.template_class = ProfiledTemplate
+templates.env.add_extension(FragmentCacheExtension)
+templates.env.add_extension(TranslationInlineExtension)
 templates.env.globals["t"] = t
 templates.env.globals["lang_ctx"] = lang_ctx
 templates.env.globals["theme"] = theme
-templates.env.globals["themed"] = themed
 templates.env.globals["site_slug"] = site_slug
 templates.env.globals["is_site"] = is_site
 templates.env.globals["settings"] = settings
+templates.env.globals["ready"] = ready
+templates.env.globals["flush"] = flush
@@ -0,0 +1,70 @@
+# app/core/translation_inline.py
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Mapping
+
+from jinja2.ext import Extension
+from jinja2.lexer import Token
+
+# tokens around `t` that mean the template binds its own `t`
+# ({% set t %}, {% for t in %}, {% macro t() %}, macro params, kwargs, imports)
+_BINDING_PREV = frozenset({"set", "for", "macro", "as", "import", "with"})
+_BINDING_NEXT = frozenset({"assign", "comma", "rparen"})
+
+
+def _binds_t(tokens: list[Token]) -> bool:
+    for i, tok in enumerate(tokens):
+        if tok.type != "name" or tok.value != "t":
+            continue
+        prev = tokens[i - 1] if i else None
+        nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+        if prev is not None and prev.type == "name" and prev.value in _BINDING_PREV:
+            return True
+        if nxt is not None and (nxt.type in _BINDING_NEXT or (nxt.type == "name" and nxt.value == "in")):
+            return True
+    return False
+
+
+def _inline(tokens: list[Token], table: Mapping[str, str]) -> Iterator[Token]:
+    i, n = 0, len(tokens)
+    while i < n:
+        tok = tokens[i]
+        if (
+            tok.type == "name"
+            and tok.value == "t"
+            and i + 3 < n
+            and tokens[i + 1].type == "lparen"
+            and tokens[i + 2].type == "string"
+            and tokens[i + 3].type == "rparen"
+            and not (i and tokens[i - 1].type in ("dot", "pipe"))
+        ):
+            key = tokens[i + 2].value
+            yield Token(tok.lineno, "string", table.get(key, key))
+            i += 4
+            continue
+        yield tok
+        i += 1
+
+
+class TranslationInlineExtension(Extension):
+    """
+    Replaces t('constant') with the translated text while compiling.
+
+    Only active on environments specialised for one (theme, lang): those carry
+    `inline_translations`, the merged table t() would read at render time.
+    Calls with computed keys are left alone and still go through t(). A
+    template that binds its own `t` is compiled unchanged.
+    """
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(inline_translations=None)
+
+    def filter_stream(self, stream) -> Iterable[Token]:
+        table = self.environment.inline_translations
+        if table is None:
+            return stream
+        tokens = list(stream)
+        if _binds_t(tokens):
+            return iter(tokens)
+        return _inline(tokens, table)
@@ -1,4 +1,5 @@
 # app/main.py
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -7,15 +8,21 @@ import httpx
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from app.core.language_middleware import LanguageMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.early_hints import EarlyHintsMiddleware
+from app.core.request_context import RequestContextMiddleware
 from app.core.settings import settings
-from app.core.site_resolver import SiteResolverMiddleware
+from app.core.site_resolver import keep_site_index_fresh, refresh_site_index
+from app.core.template_deps import analyze_templates
+from app.core.templates import build_translation_tables, precompile_templates
 from app.routers.about_expo_router import router as about_expo_router
 from app.routers.about_forum_router import router as about_forum_router
 from app.routers.agenda_router import router as agenda_router
 from app.routers.expo_sectors_router import router as expo_sectors_router
 from app.routers.faq_router import router as faq_router
 from app.routers.internal_cache_router import router as internal_cache_router
+from app.routers.internal_templates_router import \
+    router as internal_templates_router
 from app.routers.news_router import router as news_router
 from app.routers.official_support_router import \
     router as official_support_router
@@ -46,16 +53,26 @@ async def lifespan(app: FastAPI):
         http2=True,
     )
     _set_assets_version(app)
+    build_translation_tables()
+    precompile_templates()
+    analyze_templates(["index.html"])
+    index_task = None
+    if settings.SITE_INDEX_FROM_DB:
+        await refresh_site_index()
+        index_task = asyncio.create_task(keep_site_index_fresh(settings.SITE_INDEX_REFRESH))
     try:
         yield
     finally:
+        if index_task is not None:
+            index_task.cancel()
         await app.state.http.aclose()
 
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
-app.add_middleware(SiteResolverMiddleware)
-app.add_middleware(LanguageMiddleware)
+app.add_middleware(RequestContextMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(EarlyHintsMiddleware)  # outermost: a 103 must precede every other layer
 
 
 @app.get("/healthz")
@@ -79,4 +96,5 @@ app.include_router(privacy_router)
 app.include_router(agenda_router)
 app.include_router(timer_router)
 app.include_router(internal_cache_router)
+app.include_router(internal_templates_router)
  
\ No newline at end of file
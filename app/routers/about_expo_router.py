@@ -2,15 +2,16 @@
 from fastapi import APIRouter, Request
 from starlette.responses import HTMLResponse
 
+from ..core.page_cache import cached_page
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
 
 @router.get("/about-the-expo", response_class=HTMLResponse)
+@cached_page("about_expo")
 async def about_expo(req: Request):
     lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
     ctx = {"request": req, "lang": lang, "settings": settings}
-    template_name = themed_name(req, "about_expo.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("about_expo.html", ctx)
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Request
 from starlette.responses import HTMLResponse
 
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
@@ -12,5 +12,4 @@ router = APIRouter()
 async def about_forum(req: Request):
     lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
     ctx = {"request": req, "lang": lang, "settings": settings}
-    template_name = themed_name(req, "about_forum.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("about_forum.html", ctx)
@@ -5,20 +5,21 @@ from starlette.responses import HTMLResponse
 
 from app.services import expo_sectors as sectors_srv
 
+from ..core.page_cache import cached_page
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
 
 @router.get("/expo-sectors", response_class=HTMLResponse)
+@cached_page("expo_sectors")
 async def expo_sectors_page(req: Request):
     lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
     # ⬇️ pass req and await the async function
     sectors = await sectors_srv.list_home_sectors(req, limit=1000, latest_first=False)
     ctx = {"request": req, "lang": lang, "settings": settings, "sectors": sectors}
-    template_name = themed_name(req, "expo_sectors.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("expo_sectors.html", ctx)
 
 
 @router.get("/expo-sectors/{sector_id}", response_class=HTMLResponse)
@@ -31,5 +32,4 @@ async def expo_sector_detail(req: Request, sector_id: int):
 
     debug = req.query_params.get("debug")
     ctx = {"request": req, "lang": lang, "settings": settings, "sector": sector, "debug": debug}
-    template_name = themed_name(req, "expo_sector_detail.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("expo_sector_detail.html", ctx)
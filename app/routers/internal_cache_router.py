@@ -4,32 +4,38 @@ from __future__ import annotations
 from fastapi import APIRouter, Header, HTTPException, Query
 from starlette import status
 
-from app.core.settings import settings
+from app.core.internal_auth import check_internal_token
 from app.services import speakers as speakers_srv
+from app.services.agenda import fetch_path_stats
+from app.core.page_cache import PAGE_CACHE_PREFIX
+from app.core.site_resolver import invalidate_site_index, site_index_stats
+from app.utils.timed_cache import cache_stats, invalidate_registered
 
 router = APIRouter(prefix="/internal/cache", tags=["internal"])
 
 
-_INVALIDATORS = {
-    "speakers": speakers_srv.invalidate_caches,
-    "all": speakers_srv.invalidate_caches,
-}
+def _invalidate_pages() -> None:
+    invalidate_registered(PAGE_CACHE_PREFIX)
+
 
+def _invalidate_agenda() -> None:
+    invalidate_registered("episodes")
+    _invalidate_pages()
 
-def _check_token(authorization: str | None, token_q: str | None) -> None:
-    expected = (settings.INTERNAL_CACHE_TOKEN or "").strip()
-    if not expected:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="invalidation disabled")
 
-    provided = ""
-    if authorization:
-        parts = authorization.split(None, 1)
-        provided = parts[1].strip() if len(parts) == 2 and parts[0].lower() == "bearer" else authorization.strip()
-    if not provided and token_q:
-        provided = token_q.strip()
+def _invalidate_speakers() -> None:
+    speakers_srv.invalidate_caches()
+    # the composed agenda and rendered pages embed speaker data, drop them too
+    _invalidate_agenda()
 
-    if provided != expected:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
+
+_INVALIDATORS = {
+    "speakers": _invalidate_speakers,
+    "pages": _invalidate_pages,
+    "agenda": _invalidate_agenda,
+    "sites": invalidate_site_index,
+    "all": invalidate_registered,
+}
 
 
 @router.post("/invalidate")
@@ -38,9 +44,18 @@ async def invalidate(
     authorization: str | None = Header(default=None),
     token: str | None = Query(default=None),
 ):
-    _check_token(authorization, token)
+    check_internal_token(authorization, token)
     fn = _INVALIDATORS.get(kind)
     if not fn:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"unknown kind: {kind}")
     fn()
     return {"ok": True, "kind": kind}
+
+
+@router.get("/stats")
+async def stats(
+    authorization: str | None = Header(default=None),
+    token: str | None = Query(default=None),
+):
+    check_internal_token(authorization, token)
+    return {**cache_stats(), "agenda_fetch": fetch_path_stats(), "site_index": site_index_stats()}
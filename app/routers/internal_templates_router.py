@@ -0,0 +1,29 @@
+# app/routers/internal_templates_router.py
+from __future__ import annotations
+
+from fastapi import APIRouter, Header, Query
+
+from app.core.internal_auth import check_internal_token
+from app.core.settings import settings
+from app.core.template_profiler import profile_stats, reset_profile_stats
+
+router = APIRouter(prefix="/internal/templates", tags=["internal"])
+
+
+@router.get("/profile")
+async def profile(
+    authorization: str | None = Header(default=None),
+    token: str | None = Query(default=None),
+):
+    check_internal_token(authorization, token)
+    return {"enabled": settings.TEMPLATE_PROFILING, **profile_stats()}
+
+
+@router.post("/profile/reset")
+async def reset_profile(
+    authorization: str | None = Header(default=None),
+    token: str | None = Query(default=None),
+):
+    check_internal_token(authorization, token)
+    reset_profile_stats()
+    return {"ok": True}
@@ -10,7 +10,7 @@ from starlette.responses import HTMLResponse
 from app.services import news as news_srv
 
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
@@ -57,8 +57,7 @@ async def news_list(
         "per_page": per_page,
         "total_pages": max(total_pages, 1),
     }
-    template_name = themed_name(req, "news.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("news.html", ctx)
 
 
 @router.get("/news/{news_id}", response_class=HTMLResponse)
@@ -68,5 +67,4 @@ async def news_detail(req: Request, news_id: int):
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="News not found")
     ctx = {"request": req, "lang": lang, "settings": settings, "item": record}
-    template_name = themed_name(req, "news_detail.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("news_detail.html", ctx)
@@ -7,7 +7,7 @@ from urllib.parse import quote
 from fastapi import APIRouter, Request
 from starlette.responses import HTMLResponse
 
-from app.core.templates import templates, themed_name
+from app.core.templates import templates
 
 router = APIRouter()
 
@@ -139,7 +139,7 @@ def _resolve_doc_path(req: Request, exts: Iterable[str] = (".png", ".jpg", ".jpe
 
 @router.get("/official-support", response_class=HTMLResponse)
 async def official_support_page(request: Request):
-    template_name = themed_name(request, "official_support.html")
+    template_name = "official_support.html"
     doc_path = _resolve_doc_path(request)
     suffix = doc_path.suffix.lower() if doc_path else ""
     doc_is_pdf = suffix == ".pdf"
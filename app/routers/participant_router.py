@@ -6,7 +6,7 @@ from starlette.responses import HTMLResponse, JSONResponse
 from app.services import participants as participants_srv
 
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
@@ -19,8 +19,7 @@ async def participants_page(req: Request):
 
     items = await participants_srv.list_participants(req, limit=12, offset=0, latest_first=False, role=role, q=q)
     ctx = {"request": req, "lang": lang, "settings": settings, "participants": items, "role": role, "q": q}
-    template_name = themed_name(req, "participants.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("participants.html", ctx)
 
 
 @router.get("/api/participants", response_class=JSONResponse)
@@ -35,7 +34,7 @@ async def participants_api(
     has_more = len(items) > limit
     items = items[:limit]
     next_offset = offset + limit if has_more else None
-    return JSONResponse({"items": items, "next_offset": next_offset})
+    return JSONResponse({"items": [p.to_dict() for p in items], "next_offset": next_offset})
 
 
 @router.get("/participants/{participant_id}", response_class=HTMLResponse)
@@ -46,5 +45,4 @@ async def participant_detail(req: Request, participant_id: int):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Participant not found")
     debug = req.query_params.get("debug")
     ctx = {"request": req, "lang": lang, "settings": settings, "participant": participant, "debug": debug}
-    template_name = themed_name(req, "participant_detail.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("participant_detail.html", ctx)
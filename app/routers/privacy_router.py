@@ -8,7 +8,7 @@ from app.routers.site import _resolve_site_id
 from app.services import privacy as legal_srv
 
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
@@ -29,5 +29,4 @@ async def privacy_policy_page(req: Request):
         "settings": settings,
         "privacy": doc,
     }
-    template_name = themed_name(req, "privacy.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("privacy.html", ctx)
@@ -1,11 +1,12 @@
 # app/routers/site.py
 import logging
-from asyncio import create_task, gather
+from asyncio import Task, create_task, gather
+from typing import Awaitable
 
 from fastapi import APIRouter, Request, Response
 from starlette.responses import HTMLResponse, RedirectResponse
 
-from app.core.language_middleware import LANG_COOKIE
+from app.core.request_context import LANG_COOKIE
 from app.services import expo_sectors as sectors_srv
 from app.services import faqs as faq_srv
 from app.services import news as news_srv
@@ -17,7 +18,9 @@ from app.services import sponsors as sponsor_srv
 from app.services import statistics as stats_srv
 from app.services import timer as timer_srv
 
+from ..core.page_cache import cached_page
 from ..core.settings import settings
+from ..core.template_deps import context_names, wants
 from ..core.templates import templates
 
 router = APIRouter()
@@ -85,6 +88,75 @@ def _resolve_home_limits(req: Request) -> dict:
     return limits
 
 
+def _empty_top() -> dict:
+    return {t: [] for t in ("premier", "general", "diamond", "platinum")}
+
+
+async def _listed(log: logging.Logger, label: str, aw: Awaitable) -> list:
+    try:
+        return (await aw) or []
+    except Exception as exc:
+        log.warning("home(): %s failed: %r", label, exc)
+        return []
+
+
+async def _sponsors_bundle(log: logging.Logger, aw: Awaitable) -> dict:
+    try:
+        return await aw
+    except Exception as exc:
+        log.warning("home(): sponsors bundle failed: %r", exc)
+        return {
+            "sponsors_top": _empty_top(),
+            "sponsors_top_flat": {"items": [], "count": 0},
+            "sponsors_top_view": {"items": [], "count": 0, "layout": "empty", "max": 5},
+            "gold": {"items": [], "tier": "gold", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
+            "silver": {"items": [], "tier": "silver", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
+            "bronze": {"items": [], "tier": "bronze", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
+        }
+
+
+async def _statistics(log: logging.Logger, aw: Awaitable) -> dict:
+    try:
+        return await aw
+    except Exception as exc:
+        log.warning("home(): statistics failed: %r", exc)
+        return {"episodes": 0, "delegates": 0, "speakers": 0, "companies": 0}
+
+
+async def _pick(bundle: Awaitable[dict], key: str, default):
+    return (await bundle).get(key, default)
+
+
+async def _items(items: Awaitable[list]) -> dict:
+    return {"items": await items}
+
+
+# home-page sponsor views picked from the sponsors bundle, with their fallbacks
+_SPONSOR_VIEWS = {
+    "sponsors_top": _empty_top(),
+    "sponsors_top_flat": {"items": [], "count": 0},
+    "sponsors_top_view": {"items": [], "count": 0, "layout": "empty"},
+    "gold": {"items": [], "tier": "gold", "count": 0, "layout": "empty"},
+    "silver": {"items": [], "tier": "silver", "count": 0, "layout": "empty"},
+    "bronze": {"items": [], "tier": "bronze", "count": 0, "layout": "empty"},
+}
+
+# home-page participant views: (roles, or None for all; limits key)
+_PARTICIPANT_VIEWS = {
+    "participants": (None, "participants_home"),
+    "participants_expo": ({"expo", "both"}, "participants_expo"),
+    "participants_forum": ({"forum", "both"}, "participants_forum"),
+    "participants_both": ({"both"}, "participants_both"),
+}
+
+
+async def _participants(everyone: Awaitable[list], roles: set[str] | None, limit: int) -> list:
+    rows = await everyone
+    if roles is not None:
+        rows = [p for p in rows if p.get("role") in roles]
+    return rows[:limit]
+
+
 @router.post("/set-lang/{code}")
 def set_lang(code: str, request: Request, response: Response):
     code = (code or "").lower().split("-")[0]
@@ -96,6 +168,7 @@ def set_lang(code: str, request: Request, response: Response):
 
 
 @router.get("/", response_class=HTMLResponse)
+@cached_page("home")
 async def home(req: Request):
     log = logging.getLogger("routers.site.home")
 
@@ -103,13 +176,16 @@ async def home(req: Request):
     site_id = _resolve_site_id(req)
     limits = _resolve_home_limits(req)
 
+    # only fetch what this theme's index templates actually read
+    used = context_names(getattr(getattr(req.state, "site", None), "slug", None), "index.html")
+
     # timer (sync)
     deadline_dt = timer_srv.get_deadline_from_settings(settings)
     timer_ctx = timer_srv.build_timer_context(deadline_dt)
 
     # Extract show_sponsor_tiers setting from database (controls tier label visibility)
     show_sponsor_tiers = True  # default
-    if site_id:
+    if site_id and wants(used, "show_sponsor_tiers"):
         from app.core.db import get_db
         from app.models.site_model import Site
         db_gen = get_db()
@@ -124,122 +200,13 @@ async def home(req: Request):
             except Exception:
                 pass
 
-    sponsors_bundle_task = create_task(
-        sponsor_srv.get_homepage_bundle(lang=lang, site_id=site_id, max_top_items=5)
-    )
-    stats_task = create_task(stats_srv.get_statistics(req, site_id=site_id))
-
-    # async fetches — use site-aware limits
-    sectors_task = create_task(sectors_srv.list_home_sectors(req, limit=limits["sectors_fetch"], latest_first=True))
-    news_task = create_task(news_srv.get_latest_news(req, limit=limits["news"]))
-    faqs_task = create_task(faq_srv.list_faqs(req, limit=limits["faqs"]))
-    speakers_task = create_task(speakers_srv.get_featured_speakers(req, limit=limits["speakers"]))
-    organizers_task = create_task(org_srv.list_organizers(req, limit=None))
-    partners_task = create_task(partners_srv.list_partners(req, limit=None))
-    participants_all_task = create_task(participants_srv.list_participants(req, limit=limits["participants_all"], latest_first=True))
-
-    results = await gather(
-        sectors_task,
-        news_task,
-        faqs_task,
-        speakers_task,
-        organizers_task,
-        partners_task,
-        participants_all_task,
-        return_exceptions=True,
-    )
-
-    def _ok(idx):
-        val = results[idx]
-        if isinstance(val, Exception):
-            log.warning("home(): task %d failed: %r", idx, val)
-            return []
-        return val or []
-
-    sectors = _ok(0)
-    news = _ok(1)
-    faqs = _ok(2)
-    speakers = _ok(3)
-    organizers = _ok(4)
-    partners = _ok(5)
-    participants_all = _ok(6)
-
-    # Derive participant slices with limits
-    participants = participants_all[:limits["participants_home"]]
-    participants_expo = [p for p in participants_all if (p.get("role") in {"expo", "both"})][:limits["participants_expo"]]
-    participants_forum = [p for p in participants_all if (p.get("role") in {"forum", "both"})][:limits["participants_forum"]]
-    participants_both = [p for p in participants_all if p.get("role") == "both"][:limits["participants_both"]]
-
-    def _empty_top():
-        return {t: [] for t in ("premier", "general", "diamond", "platinum")}
-
-    try:
-        sponsors_bundle = await sponsors_bundle_task
-    except Exception as exc:
-        log.warning("home(): sponsors bundle failed: %r", exc)
-        sponsors_bundle = {
-            "sponsors_top": _empty_top(),
-            "sponsors_top_flat": {"items": [], "count": 0},
-            "sponsors_top_view": {"items": [], "count": 0, "layout": "empty", "max": 5},
-            "gold": {"items": [], "tier": "gold", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
-            "silver": {"items": [], "tier": "silver", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
-            "bronze": {"items": [], "tier": "bronze", "count": 0, "layout": "empty", "rows": [], "marquee_rows": []},
-        }
-
-    try:
-        stats = await stats_task
-    except Exception as exc:
-        log.warning("home(): statistics failed: %r", exc)
-        stats = {"episodes": 0, "delegates": 0, "speakers": 0, "companies": 0}
-
+    # Every data value below is a task: streamed renders wait for each one
+    # in the template (ready()), ordinary renders resolve them all up front.
     ctx = {
         "request": req,
         "lang": lang,
         "settings": settings,
-
-        # sponsors/statistics
-        "sponsors_top": sponsors_bundle.get("sponsors_top", _empty_top()),
-        "sponsors_top_flat": sponsors_bundle.get("sponsors_top_flat", {"items": [], "count": 0}),
-        "sponsors_top_view": sponsors_bundle.get("sponsors_top_view", {"items": [], "count": 0, "layout": "empty"}),
-        "gold": sponsors_bundle.get("gold", {"items": [], "tier": "gold", "count": 0, "layout": "empty"}),
-        "silver": sponsors_bundle.get("silver", {"items": [], "tier": "silver", "count": 0, "layout": "empty"}),
-        "bronze": sponsors_bundle.get("bronze", {"items": [], "tier": "bronze", "count": 0, "layout": "empty"}),
         "show_sponsor_tiers": show_sponsor_tiers,
-        "stats": stats,
-
-        # async results (flat + {items:[…]} for theme compatibility)
-        "sectors": sectors,
-        "sectors_data": {
-            "items": sectors
-        },
-        "news": news,
-        "news_data": {
-            "items": news
-        },
-        "faqs": faqs,
-        "faqs_data": {
-            "items": faqs
-        },
-        "speakers": speakers,
-        "speakers_data": {
-            "items": speakers
-        },
-
-        # organizers / partners (flat + items)
-        "organizers": organizers,
-        "organizers_data": {
-            "items": organizers
-        },
-        "partners": partners,
-        "partners_data": {
-            "items": partners
-        },
-
-        # participants (derived locally)
-        "participants": participants,
-        "participants_expo": participants_expo,
-        "participants_forum": participants_forum,
-        "participants_both": participants_both,
 
         # limits exposed to templates (e.g., sectors slice)
         "limits": limits,
@@ -248,4 +215,46 @@ async def home(req: Request):
         "timer": timer_ctx,
     }
 
+    # sponsors/statistics
+    if wants(used, *_SPONSOR_VIEWS):
+        sponsors_bundle_task = create_task(
+            _sponsors_bundle(log, sponsor_srv.get_homepage_bundle(lang=lang, site_id=site_id, max_top_items=5))
+        )
+        for key, default in _SPONSOR_VIEWS.items():
+            if wants(used, key):
+                ctx[key] = create_task(_pick(sponsors_bundle_task, key, default))
+    if wants(used, "stats"):
+        ctx["stats"] = create_task(_statistics(log, stats_srv.get_statistics(req, site_id=site_id)))
+
+    # async fetches — use site-aware limits; flat + {items:[…]} for theme compatibility
+    lists = {
+        "sectors": lambda: sectors_srv.list_home_sectors(req, limit=limits["sectors_fetch"], latest_first=True),
+        "news": lambda: news_srv.get_latest_news(req, limit=limits["news"]),
+        "faqs": lambda: faq_srv.list_faqs(req, limit=limits["faqs"]),
+        "speakers": lambda: speakers_srv.get_featured_speakers(req, limit=limits["speakers"]),
+        "organizers": lambda: org_srv.list_organizers(req, limit=None),
+        "partners": lambda: partners_srv.list_partners(req, limit=None),
+    }
+    for key, fetch in lists.items():
+        if not wants(used, key, f"{key}_data"):
+            continue
+        task = create_task(_listed(log, key, fetch()))
+        if wants(used, key):
+            ctx[key] = task
+        if wants(used, f"{key}_data"):
+            ctx[f"{key}_data"] = create_task(_items(task))
+
+    # participants (derived locally, with limits)
+    if wants(used, *_PARTICIPANT_VIEWS):
+        participants_all_task = create_task(_listed(log, "participants", participants_srv.list_participants(req, limit=limits["participants_all"], latest_first=True)))
+        for key, (roles, limit_key) in _PARTICIPANT_VIEWS.items():
+            if wants(used, key):
+                ctx[key] = create_task(_participants(participants_all_task, roles, limits[limit_key]))
+
+    if settings.TEMPLATE_STREAMING:
+        return templates.StreamingTemplateResponse("index.html", ctx)
+
+    pending = [k for k, v in ctx.items() if isinstance(v, Task)]
+    for key, value in zip(pending, await gather(*(ctx[k] for k in pending))):
+        ctx[key] = value
     return templates.TemplateResponse("index.html", ctx)
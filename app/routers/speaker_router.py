@@ -7,21 +7,22 @@ from starlette.responses import HTMLResponse
 
 from app.services import speakers as speakers_srv
 
+from ..core.page_cache import cached_page
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
 
 # app/routers/speakers_router.py (or wherever)
 @router.get("/speakers", response_class=HTMLResponse)
+@cached_page("speakers", vary_query=("page",))
 async def speakers_page(req: Request, page: int = 1):
     lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
     q = req.query_params.get("q") or ""
     items, total_pages, total_items = await speakers_srv.list_speakers_page(req, page=page, per_page=8)
     ctx = {"request": req, "lang": lang, "settings": settings, "speakers": items, "current_page": page, "total_pages": total_pages, "total_items": total_items, "q": q}
-    template_name = themed_name(req, "speakers.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("speakers.html", ctx)
 
 
 @router.get("/speakers/{speaker_id}", response_class=HTMLResponse)
@@ -31,5 +32,4 @@ async def speaker_detail(req: Request, speaker_id: int):
     if not sp:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Speaker not found")
     ctx = {"request": req, "lang": lang, "settings": settings, "speaker": sp}
-    template_name = themed_name(req, "speaker_detail.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("speaker_detail.html", ctx)
@@ -8,7 +8,7 @@ from app.routers.site import _resolve_site_id
 from app.services import terms as legal_srv
 
 from ..core.settings import settings
-from ..core.templates import templates, themed_name
+from ..core.templates import templates
 
 router = APIRouter()
 
@@ -29,5 +29,4 @@ async def terms_of_use_page(req: Request):
         "settings": settings,
         "terms": doc,
     }
-    template_name = themed_name(req, "terms.html")
-    return templates.TemplateResponse(template_name, ctx)
+    return templates.TemplateResponse("terms.html", ctx)
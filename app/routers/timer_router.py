@@ -18,7 +18,7 @@ async def get_active_timer(
 ):
     client: httpx.AsyncClient = request.app.state.http
 
-    # ✅ Auto-detect current site slug from SiteResolverMiddleware
+    # ✅ Auto-detect current site slug from RequestContextMiddleware
     resolved_slug = getattr(getattr(request.state, "site", None), "slug", None) or None
     if not site and site_id is None and resolved_slug:
         site = resolved_slug
@@ -1,16 +1,25 @@
 # app/services/agenda.py
 from __future__ import annotations
 
+import time
 from datetime import date as _date  # ← add this
 from datetime import datetime as _dt
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import Request
 
 from app.core.http import api_get
+from app.core.settings import settings
 
 DAYS_PATH = "/agenda/days"
 DAY_EPISODES_PATH = "/agenda/day/{day_id}/episodes"
+# days with their episodes nested under "episodes", in one response
+WHOLE_AGENDA_PATH = "/agenda/full"
+WHOLE_AGENDA_RECHECK = 300.0
+
+_whole_unsupported_until = 0.0
+# how list_days_with_episodes() fetched, per call
+_FETCH_PATHS = {"whole": 0, "per_day": 0}
 
 
 def _to_date(val):
@@ -115,3 +124,103 @@ async def list_episodes_for_day(req: Request, *, day_id: int, site_id: Optional[
 
     rows = rows or []
     return [_normalize_episode(r) for r in rows]
+
+
+def _params(site_id: Optional[int], only_published: bool) -> dict:
+    params = {}
+    if site_id is not None:
+        params["site_id"] = site_id
+    if only_published:
+        params["published"] = "true"
+    return params
+
+
+async def list_whole_agenda(req: Request, *, site_id: Optional[int] = None, only_published: bool = True) -> Optional[List[Tuple[dict, List[dict]]]]:
+    """
+    (day, episodes) pairs from the backend's whole-agenda endpoint in one
+    request, or None when it has no such endpoint or the request failed.
+    A backend without it is not asked again for WHOLE_AGENDA_RECHECK seconds.
+    """
+    import logging
+
+    import httpx
+    log = logging.getLogger("services.agenda")
+
+    global _whole_unsupported_until
+    if time.monotonic() < _whole_unsupported_until:
+        return None
+
+    try:
+        data = await api_get(req, WHOLE_AGENDA_PATH, params=_params(site_id, only_published))
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (404, 405, 501):
+            log.info("agenda: no whole-agenda endpoint (%s), using per-day requests", e.response.status_code)
+            _whole_unsupported_until = time.monotonic() + WHOLE_AGENDA_RECHECK
+        else:
+            log.error("agenda.list_whole_agenda HTTP error: %r", e)
+        return None
+    except Exception as e:
+        log.warning("agenda.list_whole_agenda failed: %r", e)
+        return None
+
+    rows = data.get("days") if isinstance(data, dict) else data
+    if not isinstance(rows, list):
+        log.warning("agenda.list_whole_agenda: unexpected payload %s", type(data).__name__)
+        return None
+    return [
+        (_normalize_day(r), [_normalize_episode(e) for e in (r.get("episodes") or []) if isinstance(e, dict)])
+        for r in rows
+        if isinstance(r, dict)
+    ]
+
+
+async def _list_days_fan_out(req: Request, *, site_id: Optional[int], only_published: bool) -> List[Tuple[dict, List[dict]]]:
+    import asyncio
+    import logging
+    log = logging.getLogger("services.agenda")
+
+    days = await list_days(req, site_id=site_id, only_published=only_published)
+    if not days:
+        return []
+
+    # Fetch all episodes for all days concurrently
+    ep_tasks = [asyncio.create_task(list_episodes_for_day(req, day_id=d["id"], site_id=site_id, only_published=only_published)) for d in days if d and d.get("id") is not None]
+    ep_results = await asyncio.gather(*ep_tasks, return_exceptions=True)
+
+    # Map day -> episodes safely
+    out: List[Tuple[dict, List[dict]]] = []
+    i = 0
+    for d in days:
+        if d and d.get("id") is not None:
+            res = ep_results[i]
+            i += 1
+            if isinstance(res, Exception):
+                log.warning("episodes for day %s failed: %r", d.get("id"), res)
+                out.append((d, []))
+            else:
+                out.append((d, res or []))
+        else:
+            out.append((d, []))
+    return out
+
+
+async def list_days_with_episodes(req: Request, *, site_id: Optional[int] = None, only_published: bool = True) -> List[Tuple[dict, List[dict]]]:
+    """
+    Every day with its episodes: one whole-agenda request when the backend
+    offers it (and AGENDA_WHOLE_FETCH is on), else /agenda/days plus one
+    request per day. fetch_path_stats() counts which way each call went.
+    """
+    if settings.AGENDA_WHOLE_FETCH:
+        whole = await list_whole_agenda(req, site_id=site_id, only_published=only_published)
+        if whole is not None:
+            _FETCH_PATHS["whole"] += 1
+            return whole
+    _FETCH_PATHS["per_day"] += 1
+    return await _list_days_fan_out(req, site_id=site_id, only_published=only_published)
+
+
+def fetch_path_stats() -> dict:
+    return {
+        **_FETCH_PATHS,
+        "whole_supported": time.monotonic() >= _whole_unsupported_until,
+    }
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-import re
+import asyncio
+import logging
+import time
 from datetime import datetime as _dt
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
+from app.core.db import db_context
 from app.core.http import abs_media, api_get
 from app.core.settings import settings
+from app.models import AgendaDay, Moderator, Speaker, Sponsor
 from app.models.episode_model import Episode
-from app.services.agenda import list_days, list_episodes_for_day
-from app.services.text_utils import compose_position_line, is_blank_text
+from app.services.agenda import _normalize_day, list_days_with_episodes
+from app.services.text_utils import (
+    compose_position_line,
+    is_blank_text,
+    normalize_textblock,
+    short_text,
+    split_short_and_topic,
+    strip_markdown,
+)
+from app.utils.timed_cache import LoopCache
 
 # ---------------- utils ----------------
 
@@ -33,30 +48,6 @@ def _resolve_media(path: Optional[str]) -> str:
     return abs_media(path)
 
 
-def _strip_md(text: str) -> str:
-    if not text:
-        return ""
-    s = text
-    s = re.sub(r"```.*?```", "", s, flags=re.S)
-    s = re.sub(r"`([^`]*)`", r"\1", s)
-    s = re.sub(r"!\[([^\]]*)\]\([^\)]*\)", r"\1", s)
-    s = re.sub(r"\[([^\]]*)\]\([^\)]*\)", r"\1", s)
-    s = re.sub(r"(^|\n)#+\s*", r"\1", s)
-    s = re.sub(r"[*_~]{1,3}", "", s)
-    s = re.sub(r"[-*]\s+", "", s)
-    s = re.sub(r"<[^>]+>", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
-def _short_text(text: str, length: int = 240) -> str:
-    t = _strip_md(text or "")
-    if len(t) <= length:
-        return t
-    cut = t[:length].rsplit(" ", 1)[0]
-    return cut + "…"
-
-
 def _as_int(val) -> Optional[int]:
     if isinstance(val, int):
         return val
@@ -186,7 +177,7 @@ def _flatten_person_like(x: dict) -> dict:
         desc_plain = ""
     if is_blank_text(desc_html):
         desc_html = ""
-    desc_norm = _strip_md(desc_plain or desc_html)
+    desc_norm = strip_markdown(desc_plain or desc_html)
     position = merged.get("position") or ""
     company = merged.get("company") or ""
     return {
@@ -236,7 +227,7 @@ def episode_to_view(ep: Episode) -> dict:
         "slug": getattr(ep, "slug", "") or "",
         "title": getattr(ep, "title", "") or "",
         "description_md": getattr(ep, "description_md", "") or "",
-        "short_desc": _short_text(getattr(ep, "short_desc", None) or getattr(ep, "description_md", "") or "", 240),
+        "short_desc": short_text(getattr(ep, "short_desc", None) or getattr(ep, "description_md", "") or "", 240),
         "topic_desc": getattr(ep, "topic_desc", "") or getattr(ep, "topic", "") or "",
         "start_time": getattr(ep, "start_time", None),
         "end_time": getattr(ep, "end_time", None),
@@ -259,23 +250,86 @@ def episode_to_view(ep: Episode) -> dict:
     return base
 
 
+# ---------------- database loader ----------------
+
+# what episode_to_view() reads; everything else stays unloaded
+_EPISODE_COLUMNS = (
+    Episode.id, Episode.day_id, Episode.site_id, Episode.title, Episode.slug, Episode.description_md,
+    Episode.start_time, Episode.end_time, Episode.location, Episode.published, Episode.sort_order,
+    Episode.hero_image_url,
+)
+_DAY_COLUMNS = (AgendaDay.id, AgendaDay.date, AgendaDay.label, AgendaDay.published, AgendaDay.sort_order, AgendaDay.site_id)
+
+
+def _load_agenda_sync(site_id: int, only_published: bool = True) -> List[dict]:
+    """
+    A site's agenda straight from the database, shaped like
+    list_days_with_episode_views(). Five queries however large the agenda
+    is: days, episodes, and one selectin load each for speakers, moderators
+    and sponsors. Any relationship not listed raises instead of lazy-loading.
+    """
+    day_stmt = select(*_DAY_COLUMNS).where(AgendaDay.site_id == site_id)
+    ep_stmt = (
+        select(Episode)
+        .where(Episode.site_id == site_id)
+        .options(
+            load_only(*_EPISODE_COLUMNS),
+            selectinload(Episode.speakers).options(
+                load_only(Speaker.id, Speaker.name, Speaker.surname, Speaker.company, Speaker.position, Speaker.description, Speaker.photo),
+                raiseload("*"),
+            ),
+            selectinload(Episode.moderators).options(
+                load_only(Moderator.id, Moderator.name, Moderator.description, Moderator.photo),
+                raiseload("*"),
+            ),
+            selectinload(Episode.sponsors).options(
+                load_only(Sponsor.id, Sponsor.name, Sponsor.website, Sponsor.tier, Sponsor.logo),
+                raiseload("*"),
+            ),
+            raiseload("*"),
+        )
+    )
+    if only_published:
+        day_stmt = day_stmt.where(AgendaDay.published.is_(True))
+        ep_stmt = ep_stmt.where(Episode.published.is_(True))
+    day_stmt = day_stmt.order_by(AgendaDay.date, AgendaDay.sort_order, AgendaDay.id)
+    ep_stmt = ep_stmt.order_by(Episode.start_time, Episode.sort_order, Episode.id)
+
+    with db_context() as db:
+        days = [_normalize_day(dict(row._mapping)) for row in db.execute(day_stmt)]
+        by_day: Dict[int, List[dict]] = {}
+        for ep in db.execute(ep_stmt).scalars():
+            by_day.setdefault(ep.day_id, []).append(episode_to_view(ep))
+    return [{**d, "episodes": by_day.get(d["id"], [])} for d in days]
+
+
+async def list_days_with_episode_views_db(site_id: int, *, only_published: bool = True) -> List[dict]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(_load_agenda_sync, site_id, only_published))
+
+
 # ---------------- matching helpers ----------------
 
 
-def _episode_indices(eps: List[dict]) -> Tuple[Dict[int, dict], Dict[str, dict], Dict[str, dict]]:
-    by_id: Dict[int, dict] = {}
-    by_slug: Dict[str, dict] = {}
-    by_title: Dict[str, dict] = {}
-    for ev in eps:
-        eid = _as_int(ev.get("id"))
-        if eid is not None:
-            by_id[eid] = ev
-        slug = _norm(ev.get("slug"))
-        if slug:
-            by_slug[slug] = ev
-        title = _norm(ev.get("title"))
-        if title:
-            by_title[title] = ev
+# per key, the episode it names on each day: {key: {day index: episode}}
+_DayIndex = Dict[Any, Dict[int, dict]]
+
+
+def _episode_indices(days_evs: List[List[dict]]) -> Tuple[_DayIndex, _DayIndex, _DayIndex]:
+    by_id: _DayIndex = {}
+    by_slug: _DayIndex = {}
+    by_title: _DayIndex = {}
+    for day, eps in enumerate(days_evs):
+        for ev in eps:
+            eid = _as_int(ev.get("id"))
+            if eid is not None:
+                by_id.setdefault(eid, {})[day] = ev
+            slug = _norm(ev.get("slug"))
+            if slug:
+                by_slug.setdefault(slug, {})[day] = ev
+            title = _norm(ev.get("title"))
+            if title:
+                by_title.setdefault(title, {})[day] = ev
     return by_id, by_slug, by_title
 
 
@@ -318,44 +372,56 @@ def _extract_episode_keys_from_value(value) -> Tuple[List[int], List[str], List[
     return dedupe(ids), dedupe(slugs), dedupe(titles)
 
 
-def _attach_people_from_rows(rows: List[dict], evs: List[dict], role: str):
-    by_id, by_slug, by_title = _episode_indices(evs)
+def _matches_by_day(keys: List[Any], index: _DayIndex) -> Dict[int, List[dict]]:
+    found: Dict[int, List[dict]] = {}
+    for key in keys:
+        for day, ev in index.get(key, {}).items():
+            found.setdefault(day, []).append(ev)
+    return found
+
+
+def _attach_people_from_rows(rows: List[dict], indices: Tuple[_DayIndex, _DayIndex, _DayIndex], role: str):
+    """
+    Attach each row's person to the episodes its sessions name. Within a day,
+    id matches win, then slug matches, then title matches. Every person is
+    flattened once, however many episodes and days it is attached to.
+    """
+    by_id, by_slug, by_title = indices
+    field = "speakers" if role == "speaker" else "moderators"
+    # id(episode) -> (ids, fullnames) already in its bucket
+    seen: Dict[int, Tuple[set, set]] = {}
+
     for row in rows or []:
         if not isinstance(row, dict):
             continue
-        person = _flatten_person_like(row)
-        if not (person.get("fullname") or person.get("id")):
-            continue
 
         # Speakers service uses "sessions"; accept many fallbacks
         session_val = (row.get("sessions") or row.get("episodes") or row.get("episode_ids") or row.get("session_ids") or row.get("session") or row.get("episode"))
         ids, slugs, titles = _extract_episode_keys_from_value(session_val)
+        id_hits = _matches_by_day(ids, by_id)
+        slug_hits = _matches_by_day(slugs, by_slug)
+        title_hits = _matches_by_day(titles, by_title)
+        if not (id_hits or slug_hits or title_hits):
+            continue
 
-        matched: List[dict] = []
-        for eid in ids:
-            ev = by_id.get(eid)
-            if ev:
-                matched.append(ev)
-        if not matched:
-            for s in slugs:
-                ev = by_slug.get(s)
-                if ev:
-                    matched.append(ev)
-        if not matched:
-            for t in titles:
-                ev = by_title.get(t)
-                if ev:
-                    matched.append(ev)
-
-        if not matched:
+        person = _flatten_person_like(row)
+        pid, name = person.get("id"), person.get("fullname")
+        if not (name or pid):
             continue
 
-        for ev in matched:
-            bucket = ev["speakers"] if role == "speaker" else ev["moderators"]
-            if not any((p.get("id") and p.get("id") == person.get("id")) or (p.get("fullname") == person.get("fullname")) for p in bucket):
-                bucket.append(person)
-            if role == "moderator" and not ev.get("first_moderator"):
-                ev["first_moderator"] = person
+        for day in sorted(id_hits.keys() | slug_hits.keys() | title_hits.keys()):
+            for ev in id_hits.get(day) or slug_hits.get(day) or title_hits[day]:
+                bucket = ev[field]
+                marks = seen.get(id(ev))
+                if marks is None:
+                    marks = seen[id(ev)] = ({p.get("id") for p in bucket if p.get("id")}, {p.get("fullname") for p in bucket})
+                if not ((pid and pid in marks[0]) or name in marks[1]):
+                    bucket.append(person)
+                    if pid:
+                        marks[0].add(pid)
+                    marks[1].add(name)
+                if role == "moderator" and not ev.get("first_moderator"):
+                    ev["first_moderator"] = person
 
 
 # ---------------- main list ----------------
@@ -367,12 +433,8 @@ async def list_days_with_episode_views(
     site_id: Optional[int] = None,
     only_published: bool = True,
 ) -> List[dict]:
-    import asyncio
-    import logging
-    log = logging.getLogger("services.agenda.compose")
-
-    # Fetch days + people lists concurrently
-    days_task = asyncio.create_task(list_days(req, site_id=site_id, only_published=only_published))
+    # Fetch days/episodes + people lists concurrently
+    days_task = asyncio.create_task(list_days_with_episodes(req, site_id=site_id, only_published=only_published))
     speakers_task = asyncio.create_task(_safe_get(req, "/speakers/"))
     moderators_task = asyncio.create_task(_safe_get(req, "/moderators/"))
 
@@ -384,27 +446,9 @@ async def list_days_with_episode_views(
     if not days:
         return out
 
-    # Fetch all episodes for all days concurrently
-    ep_tasks = [asyncio.create_task(list_episodes_for_day(req, day_id=d["id"], site_id=site_id, only_published=only_published)) for d in days if d and d.get("id") is not None]
-    ep_results = await asyncio.gather(*ep_tasks, return_exceptions=True)
-
-    # Map day -> episodes safely
-    day_to_eps: List[List[dict]] = []
-    i = 0
-    for d in days:
-        if d and d.get("id") is not None:
-            res = ep_results[i]
-            i += 1
-            if isinstance(res, Exception):
-                log.warning("episodes for day %s failed: %r", d.get("id"), res)
-                day_to_eps.append([])
-            else:
-                day_to_eps.append(res or [])
-        else:
-            day_to_eps.append([])
-
-    # Build views and attach speakers/moderators
-    for d, raw_eps in zip(days, day_to_eps):
+    # Build views, then attach speakers/moderators across all days at once
+    days_evs: List[List[dict]] = []
+    for d, raw_eps in days:
         evs: List[dict] = []
         for e in raw_eps or []:
             ev = {
@@ -412,7 +456,7 @@ async def list_days_with_episode_views(
                 "slug": e.get("slug", "") or "",
                 "title": e.get("title", "") or "",
                 "description_md": e.get("description_md", "") or "",
-                "short_desc": _short_text(e.get("short_desc") or e.get("description_md") or "", 240),
+                "short_desc": short_text(e.get("short_desc") or e.get("description_md") or "", 240),
                 "topic_desc": e.get("topic_desc") or e.get("topic", "") or "",
                 "start_time": _to_dt(e.get("start_time")),
                 "end_time": _to_dt(e.get("end_time")),
@@ -438,9 +482,102 @@ async def list_days_with_episode_views(
             ev["top_sponsor"] = ev["sponsors"][0] if ev["sponsors"] else _sponsor_from_episode(e)
             evs.append(ev)
 
-        _attach_people_from_rows(speakers_rows, evs, role="speaker")
-        _attach_people_from_rows(moderators_rows, evs, role="moderator")
-
+        days_evs.append(evs)
         out.append({**d, "episodes": evs})
 
+    indices = _episode_indices(days_evs)
+    _attach_people_from_rows(speakers_rows, indices, role="speaker")
+    _attach_people_from_rows(moderators_rows, indices, role="moderator")
+
     return out
+
+
+# ---------------- cached agenda ----------------
+
+# (built at, days) per site and lang; entries past AGENDA_CACHE_MAX_AGE are dropped
+_AGENDA_CACHE: LoopCache[Tuple[float, List[dict]]] = LoopCache(
+    ttl_seconds=max(settings.AGENDA_CACHE_MAX_AGE, settings.AGENDA_CACHE_TTL),
+    name="episodes.agenda",
+)
+# cache key -> running build, so concurrent misses and refreshes share one
+_AGENDA_BUILDS: Dict[str, asyncio.Task] = {}
+
+
+def _site_cache_key(req: Request) -> str:
+    site = getattr(req.state, "site", None)
+    sid = getattr(site, "id", None) or getattr(settings, "FRONT_SITE_ID", 0)
+    slug = getattr(site, "slug", None) or getattr(settings, "FRONT_SITE_SLUG", "")
+    lang = getattr(req.state, "lang", settings.DEFAULT_LANG)
+    return f"{sid}:{slug}:{lang}"
+
+
+def _finish_agenda(days: List[dict]) -> List[dict]:
+    # the per-episode fields agenda.html reads on top of the composed views
+    for day in days:
+        for ep in (day.get("episodes") or []):
+            short, topic = split_short_and_topic(ep.get("description_md") or "")
+            ep["short_desc"] = short
+            ep["topic_desc"] = topic
+            if ep.get("moderators"):
+                ep["moderators"][0]["description_norm"] = normalize_textblock(ep["moderators"][0].get("description") or "")
+
+            sponsors = ep.get("sponsors") or []
+            ep["top_sponsor"] = sponsors[0] if sponsors else None
+    return days
+
+
+async def build_agenda(req: Request, *, site_id: Optional[int] = None) -> List[dict]:
+    """
+    The agenda page's days and episodes, composed and post-processed,
+    uncached. With AGENDA_DB_SOURCE they come from the database, and the
+    backend API is only used when that fails.
+    """
+    if settings.AGENDA_DB_SOURCE and site_id is not None:
+        try:
+            return _finish_agenda(await list_days_with_episode_views_db(site_id))
+        except Exception as e:
+            logging.getLogger("services.agenda.compose").error("agenda from database failed, using the API: %r", e)
+    days = await list_days_with_episode_views(req, site_id=site_id)
+    return _finish_agenda(days)
+
+
+def _start_build(req: Request, key: str, site_id: Optional[int]) -> asyncio.Task:
+    task = _AGENDA_BUILDS.get(key)
+    if task is not None:
+        return task
+
+    async def build() -> List[dict]:
+        days = await build_agenda(req, site_id=site_id)
+        _AGENDA_CACHE.set(key, (time.monotonic(), days))
+        return days
+
+    def done(t: asyncio.Task) -> None:
+        _AGENDA_BUILDS.pop(key, None)
+        if not t.cancelled() and t.exception() is not None:
+            logging.getLogger("services.agenda.compose").error("agenda build %s failed: %r", key, t.exception())
+
+    task = _AGENDA_BUILDS[key] = asyncio.create_task(build())
+    task.add_done_callback(done)
+    return task
+
+
+async def get_agenda(req: Request, *, site_id: Optional[int] = None) -> List[dict]:
+    """
+    build_agenda() per (site, lang) from memory. An entry older than
+    AGENDA_CACHE_TTL is still served while a background build replaces it;
+    only a missing or expired entry makes the request wait for a build.
+    The result is shared between requests: read it, don't modify it.
+    """
+    if settings.AGENDA_CACHE_TTL <= 0:
+        return await build_agenda(req, site_id=site_id)
+
+    key = f"agenda:{_site_cache_key(req)}:{site_id}"
+    entry = _AGENDA_CACHE.get(key)
+    if entry is None:
+        # shielded: a client going away must not cancel a build others wait on
+        return await asyncio.shield(_start_build(req, key, site_id))
+
+    built_at, days = entry
+    if time.monotonic() - built_at > settings.AGENDA_CACHE_TTL:
+        _start_build(req, key, site_id)
+    return days
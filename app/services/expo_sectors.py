@@ -1,56 +1,18 @@
 from __future__ import annotations
 
-import re
 from collections.abc import Iterable
 from typing import Optional
 from urllib.parse import urljoin
 
-import markdown as _md_lib
 from fastapi import Request
 
 from app.core.http import api_get
 from app.core.settings import settings
-from app.utils.timed_cache import TimedCache
+from app.services.markdown_render import md_to_html
+from app.utils.timed_cache import LoopCache
 
-_bullet_like = re.compile(r"(\S)\s-\s+")
-_LIST_CACHE = TimedCache(ttl_seconds=20.0)
-_DETAIL_CACHE = TimedCache(ttl_seconds=30.0)
-
-
-def normalize_markdown(md_text: str) -> str:
-    """Make common inline patterns parseable as Markdown lists/headings."""
-    if not md_text:
-        return ""
-    txt = md_text.replace("\r\n", "\n").replace("\r", "\n")
-    txt = re.sub(r"([^\n])(\n?)(\s*#{1,6}\s+)", r"\1\n\n\3", txt)
-    txt = re.sub(r":\s+-\s+", ":\n- ", txt)
-    txt = _bullet_like.sub(r"\1\n- ", txt)
-    txt = re.sub(r"([^\n])\n(-\s+)", r"\1\n\n\2", txt)
-
-    return txt
-
-
-def md_to_html(md_text: str) -> str:
-    """Render Markdown to HTML5. Falls back to a simple paragraphizer on errors."""
-    if not md_text:
-        return ""
-    norm = normalize_markdown(md_text)
-    try:
-        return _md_lib.markdown(
-            norm,
-            extensions=[
-                "extra",
-                "sane_lists",
-                "toc",
-                "attr_list",
-                "nl2br",
-            ],
-            output_format="html5",
-        )
-    except Exception:
-        blocks = [b.strip() for b in norm.strip().split("\n\n") if b.strip()]
-        html_blocks = ["<p>{}</p>".format(b.replace("\n", "<br>")) for b in blocks]
-        return "".join(html_blocks)
+_LIST_CACHE = LoopCache(ttl_seconds=20.0, name="expo_sectors.list")
+_DETAIL_CACHE = LoopCache(ttl_seconds=30.0, name="expo_sectors.detail")
 
 
 def _resolve_media(url: str | None) -> str:
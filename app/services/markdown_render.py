@@ -0,0 +1,88 @@
+# app/services/markdown_render.py
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+
+import markdown as _md_lib
+
+from app.core.settings import settings
+from app.services.markdown_simple import render_simple
+from app.utils.timed_cache import TimedCache
+
+_EXTENSIONS = ("extra", "sane_lists", "toc", "attr_list", "nl2br")
+
+_bullet_like = re.compile(r"(\S)\s-\s+")
+_heading_gap = re.compile(r"([^\n])(\n?)(\s*#{1,6}\s+)")
+_colon_list = re.compile(r":\s+-\s+")
+_list_gap = re.compile(r"([^\n])\n(-\s+)")
+
+# output depends only on the source text, so entries never go stale; the
+# TTL only bounds how long an unused entry can sit next to busy ones
+_HTML_CACHE: TimedCache[str] = TimedCache(
+    ttl_seconds=24 * 3600.0,
+    name="markdown.html",
+    max_entries=settings.MARKDOWN_CACHE_MAX_ENTRIES,
+    lru=True,
+)
+
+# Markdown instances are not thread-safe; each thread keeps its own
+_local = threading.local()
+
+
+def _renderer() -> _md_lib.Markdown:
+    md = getattr(_local, "md", None)
+    if md is None:
+        md = _local.md = _md_lib.Markdown(extensions=list(_EXTENSIONS), output_format="html5")
+    return md
+
+
+def normalize_markdown(md_text: str) -> str:
+    """Make common inline patterns parseable as Markdown lists/headings."""
+    if not md_text:
+        return ""
+    txt = md_text.replace("\r\n", "\n").replace("\r", "\n")
+    txt = _heading_gap.sub(r"\1\n\n\3", txt)
+    txt = _colon_list.sub(":\n- ", txt)
+    txt = _bullet_like.sub(r"\1\n- ", txt)
+    txt = _list_gap.sub(r"\1\n\n\2", txt)
+    return txt
+
+
+def render_markdown(md_text: str) -> str:
+    """
+    Render Markdown to HTML5, uncached. Text that only uses paragraphs,
+    `-` bullets and headings takes the render_simple() fast path; the rest
+    goes through Python-Markdown. Falls back to a simple paragraphizer on errors.
+    """
+    if not md_text:
+        return ""
+    norm = normalize_markdown(md_text)
+    if settings.MARKDOWN_FAST_PATH:
+        html = render_simple(norm)
+        if html is not None:
+            return html
+    try:
+        # reset() clears footnotes, toc and other per-document state
+        return _renderer().reset().convert(norm)
+    except Exception:
+        blocks = [b.strip() for b in norm.strip().split("\n\n") if b.strip()]
+        html_blocks = ["<p>{}</p>".format(b.replace("\n", "<br>")) for b in blocks]
+        return "".join(html_blocks)
+
+
+def md_to_html(md_text: str) -> str:
+    """
+    render_markdown() behind an LRU keyed by a hash of the source text, so a
+    bio or description shared by several entities, or re-fetched after its
+    detail cache expired, is converted once.
+    """
+    if not md_text:
+        return ""
+    key = hashlib.blake2b(md_text.encode("utf-8"), digest_size=16).hexdigest()
+    html = _HTML_CACHE.get(key)
+    if html is None:
+        html = render_markdown(md_text)
+        _HTML_CACHE.set(key, html)
+    return html
@@ -0,0 +1,109 @@
+# app/services/markdown_simple.py
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from markdown.extensions.toc import slugify, unique
+
+# Anything Python-Markdown (with extra, sane_lists, toc, attr_list, nl2br)
+# would treat specially inline or that starts a construct this renderer does
+# not implement: emphasis, code, links, footnotes, abbreviations, tables,
+# attribute lists, raw HTML, escapes, tabs.
+_UNSUPPORTED_CHARS = frozenset("`*_[]<>\\!|~{}\t")
+# anything the HTML preprocessor or the entity pattern could keep as a
+# reference: numeric ones even without the ";", named ones of [A-Za-z0-9]+
+_ENTITY = re.compile(r"&(?:#|[A-Za-z0-9]+;)")
+# setext underlines, horizontal rules, ordered and `+` lists, definitions
+_UNSUPPORTED_LINE = re.compile(r"[-= ]+|\d+\..*|\+ .*|:.*")
+_HEADING = re.compile(r"(#{1,6})([^#]*)")
+_BULLET = re.compile(r"- +(.*)")
+
+
+def _inline(text: str) -> str:
+    # nl2br: every newline inside a block becomes <br>
+    return text.replace("&", "&amp;").replace("\n", "<br>\n")
+
+
+def _plain(line: str) -> bool:
+    # text that stays text inside a paragraph or list item
+    return not (line.startswith(("-", "#")) or _UNSUPPORTED_LINE.fullmatch(line))
+
+
+def render_simple(norm: str) -> Optional[str]:
+    """
+    HTML for normalized Markdown that only uses paragraphs, `-` bullets and
+    `#` headings, byte-identical to what Python-Markdown produces for it
+    with the extensions markdown_render uses. Returns None for anything
+    else, and the caller falls back to Python-Markdown.
+
+    Mirrors Python-Markdown's block rules for that subset:
+    - a heading line splits its block;
+    - each bullet starts its own block after normalize_markdown(), and
+      consecutive bullet blocks form one list that turns loose (items in
+      <p>) once it has a second item;
+    - toc gives headings unique slug ids.
+    """
+    if not norm or not _UNSUPPORTED_CHARS.isdisjoint(norm) or _ENTITY.search(norm):
+        return None
+
+    out: list[str] = []
+    ids: set[str] = set()
+    items: list[str] = []  # open list
+
+    def close_list() -> None:
+        if not items:
+            return
+        if len(items) == 1:
+            out.append(f"<ul>\n<li>{items[0]}</li>\n</ul>")
+        else:
+            out.append("<ul>\n" + "\n".join(f"<li>\n<p>{it}</p>\n</li>" for it in items) + "\n</ul>")
+        items.clear()
+
+    for block in norm.split("\n\n"):
+        if not block:
+            continue
+        lines = block.split("\n")
+        # a heading line splits the block: text before it, heading, text after it
+        segments: list[list[str]] = [[]]
+        for line in lines:
+            if not line:
+                continue
+            if line != line.strip():
+                return None
+            if line.startswith("#"):
+                m = _HEADING.fullmatch(line)
+                if m is None:
+                    return None
+                segments.append([line])
+                segments.append([])
+            else:
+                segments[-1].append(line)
+
+        for seg in segments:
+            if not seg:
+                continue
+            first = seg[0]
+            if first.startswith("#"):
+                close_list()
+                m = _HEADING.fullmatch(first)
+                level, text = len(m.group(1)), m.group(2).strip()
+                hid = unique(slugify(text, "-"), ids)
+                out.append(f'<h{level} id="{hid}">{_inline(text)}</h{level}>')
+                continue
+            rest = seg[1:]
+            if any(not _plain(line) for line in rest):
+                return None
+            if first.startswith("-"):
+                m = _BULLET.fullmatch(first)
+                if m is None or not m.group(1) or not _plain(m.group(1)):
+                    return None
+                items.append(_inline("\n".join([m.group(1), *rest])))
+                continue
+            if not _plain(first):
+                return None
+            close_list()
+            out.append(f"<p>{_inline(chr(10).join(seg))}</p>")
+
+    close_list()
+    return "\n".join(out)
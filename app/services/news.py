@@ -8,10 +8,11 @@ from fastapi import Request
 
 from app.core.http import api_get
 from app.core.settings import settings
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
 
 
-_LIST_CACHE = TimedCache(ttl_seconds=30.0)
+_LIST_CACHE = LoopCache(ttl_seconds=30.0, name="news.list", intern=True)
 
 
 def _resolve_media(path: str | None) -> str:
@@ -37,17 +38,21 @@ def _date_parts(iso_str: Optional[str]) -> tuple[Optional[str], str]:
         return iso_str, ""
 
 
-def _row_to_card(row: dict) -> dict:
+class NewsCard(ViewModel):
+    __slots__ = ("id", "title", "summary", "category", "image_url", "date_iso", "date_human")
+
+
+def _row_to_card(row: dict) -> NewsCard:
     date_iso, date_human = _date_parts(row.get("created_at"))
-    return {
-        "id": row.get("id"),
-        "title": row.get("header") or "",
-        "summary": row.get("description") or "",
-        "category": row.get("category") or "News",
-        "image_url": _resolve_media(row.get("photo")),
-        "date_iso": date_iso,
-        "date_human": date_human,
-    }
+    return NewsCard(
+        id=row.get("id"),
+        title=row.get("header") or "",
+        summary=row.get("description") or "",
+        category=row.get("category") or "News",
+        image_url=_resolve_media(row.get("photo")),
+        date_iso=date_iso,
+        date_human=date_human,
+    )
 
 
 async def get_latest_news(
@@ -55,7 +60,7 @@ async def get_latest_news(
     *,
     limit: int = 5,
     include_unpublished: bool = False,
-) -> list[dict]:
+) -> list[NewsCard]:
     import asyncio
     import logging
 
@@ -131,6 +136,6 @@ async def get_news(
     if not row:
         return None
 
-    card = _row_to_card(row)
+    card = dict(_row_to_card(row))
     card["body"] = row.get("body") or row.get("description") or ""
     return card
@@ -7,27 +7,32 @@ from fastapi import Request
 
 from app.core.http import abs_media, api_get
 from app.core.settings import settings
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
+
+
+class OrganizerView(ViewModel):
+    __slots__ = ("id", "name", "website", "logo_url")
 
 
 def _resolve_media(path: str | None) -> str:
     return abs_media(path)
 
 
-def _row_to_dict(row: dict) -> dict:
-    return {
-        "id": row.get("id"),
-        "name": row.get("name") or "",
-        "website": row.get("website") or "",
-        "logo_url": _resolve_media(row.get("logo")),
-    }
+def _row_to_dict(row: dict) -> OrganizerView:
+    return OrganizerView(
+        id=row.get("id"),
+        name=row.get("name") or "",
+        website=row.get("website") or "",
+        logo_url=_resolve_media(row.get("logo")),
+    )
 
 
 async def list_organizers(
     req: Request,
     *,
     limit: Optional[int] = None,
-) -> list[dict]:
+) -> list[OrganizerView]:
     import asyncio
     import logging
 
@@ -74,7 +79,7 @@ async def as_carousel_data(
         "label": "Organizer",
         "kind": "organizers",
     }
-_LIST_CACHE = TimedCache(ttl_seconds=30.0)
+_LIST_CACHE = LoopCache(ttl_seconds=30.0, name="organizers.list", intern=True)
 
 
 def _site_cache_key(req: Request) -> str:
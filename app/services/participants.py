@@ -1,48 +1,24 @@
 # app/services/participants.py
 from __future__ import annotations
 
-import re
 from collections.abc import Iterable
 from typing import Any, Optional
 
-import markdown as _md_lib
 from fastapi import Request
 
 from app.core.http import abs_media, api_get
 from app.core.settings import settings
-from app.utils.timed_cache import TimedCache
+from app.services.markdown_render import md_to_html
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
 
-_bullet_like = re.compile(r"(\S)\s-\s+")
-_LIST_CACHE = TimedCache(ttl_seconds=20.0)
-_ALL_CACHE = TimedCache(ttl_seconds=20.0)
-_DETAIL_CACHE = TimedCache(ttl_seconds=30.0)
+_LIST_CACHE = LoopCache(ttl_seconds=20.0, name="participants.list", intern=True)
+_ALL_CACHE = LoopCache(ttl_seconds=20.0, name="participants.all")
+_DETAIL_CACHE = LoopCache(ttl_seconds=30.0, name="participants.detail")
 
 
-def normalize_markdown(md_text: str) -> str:
-    if not md_text:
-        return ""
-    txt = md_text.replace("\r\n", "\n").replace("\r", "\n")
-    txt = re.sub(r"([^\n])(\n?)(\s*#{1,6}\s+)", r"\1\n\n\3", txt)
-    txt = re.sub(r":\s+-\s+", ":\n- ", txt)
-    txt = _bullet_like.sub(r"\1\n- ", txt)
-    txt = re.sub(r"([^\n])\n(-\s+)", r"\1\n\n\2", txt)
-    return txt
-
-
-def md_to_html(md_text: str) -> str:
-    if not md_text:
-        return ""
-    norm = normalize_markdown(md_text)
-    try:
-        return _md_lib.markdown(
-            norm,
-            extensions=["extra", "sane_lists", "toc", "attr_list", "nl2br"],
-            output_format="html5",
-        )
-    except Exception:
-        blocks = [b.strip() for b in norm.strip().split("\n\n") if b.strip()]
-        html_blocks = ["<p>{}</p>".format(b.replace("\n", "<br>")) for b in blocks]
-        return "".join(html_blocks)
+class ParticipantView(ViewModel):
+    __slots__ = ("id", "name", "role", "bio", "logo_url", "images")
 
 
 def _resolve_media(path: str | None) -> str:
@@ -119,6 +95,18 @@ def _unwrap_object(payload: Any) -> dict | None:
     return None
 
 
+def _row_to_view(r: dict) -> ParticipantView:
+    logo = r.get("logo") or r.get("logo_url") or r.get("photo")
+    return ParticipantView(
+        id=r.get("id"),
+        name=r.get("name") or "",
+        role=r.get("role"),
+        bio=r.get("bio") or "",
+        logo_url=_resolve_logo_url(logo),
+        images=(),
+    )
+
+
 def _site_cache_key(req: Request) -> str:
     site = getattr(getattr(req, "state", None), "site", None)
     sid = getattr(site, "id", None) or getattr(settings, "FRONT_SITE_ID", 0)
@@ -169,7 +157,7 @@ async def list_participants(
     latest_first: bool = True,
     role: Optional[str] = None,
     q: Optional[str] = None,
-) -> list[dict]:
+) -> list[ParticipantView]:
     import asyncio
     import logging
 
@@ -212,17 +200,7 @@ async def list_participants(
 
     rows = rows[offset:offset + limit]
 
-    out: list[dict] = []
-    for r in rows:
-        logo = r.get("logo") or r.get("logo_url") or r.get("photo")
-        out.append({
-            "id": r.get("id"),
-            "name": r.get("name") or "",
-            "role": r.get("role"),
-            "bio": r.get("bio") or "",
-            "logo_url": _resolve_logo_url(logo),
-            "images": [],
-        })
+    out = [_row_to_view(r) for r in rows]
     _LIST_CACHE.set(cache_key, out)
     return out
 
@@ -1,23 +1,28 @@
 # app/services/partners.py
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from fastapi import Request
 
 from app.core.http import abs_media, api_get
 from app.core.settings import settings
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
 
 
-def _row_to_dict(row: dict) -> dict:
-    return {
-        "id": row.get("id"),
-        "name": row.get("name") or "",
-        "website": row.get("website") or "",
-        "logo_url": abs_media(row.get("logo")),
-        "type": row.get("type") or "",
-    }
+class PartnerView(ViewModel):
+    __slots__ = ("id", "name", "website", "logo_url", "type")
+
+
+def _row_to_dict(row: dict) -> PartnerView:
+    return PartnerView(
+        id=row.get("id"),
+        name=row.get("name") or "",
+        website=row.get("website") or "",
+        logo_url=abs_media(row.get("logo")),
+        type=row.get("type") or "",
+    )
 
 
 async def list_partners(
@@ -25,7 +30,7 @@ async def list_partners(
     *,
     limit: Optional[int] = None,
     latest_first: bool = True,
-) -> List[Dict]:
+) -> List[PartnerView]:
     import asyncio
     import logging
 
@@ -70,7 +75,7 @@ async def as_carousel_data(req: Request, *, limit: Optional[int] = None) -> dict
         "label": "Partner",
         "kind": "partners",
     }
-_LIST_CACHE = TimedCache(ttl_seconds=30.0)
+_LIST_CACHE = LoopCache(ttl_seconds=30.0, name="partners.list", intern=True)
 
 
 def _site_cache_key(req: Request) -> str:
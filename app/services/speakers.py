@@ -8,7 +8,8 @@ from fastapi import Request
 
 from app.core.http import abs_media, api_get
 from app.services.text_utils import compose_position_line, is_blank_text
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
 
 
 def _resolve_media(path: str | None) -> str:
@@ -30,7 +31,11 @@ def _display_full_name(first: str, surname: str, full_name_db: str) -> str:
     return " ".join(parts)
 
 
-def _row_to_dict(row: dict) -> dict:
+class SpeakerView(ViewModel):
+    __slots__ = ("id", "fullname", "name", "surname", "company", "position", "position_line", "description", "photo_url", "company_photo_url", "website", "email", "phone", "links", "sessions")
+
+
+def _row_to_dict(row: dict) -> SpeakerView:
     first = (row.get("name") or "").strip()
     surname = (row.get("surname") or "").strip()
     full_name_db = (row.get("full_name") or "").strip()
@@ -40,29 +45,29 @@ def _row_to_dict(row: dict) -> dict:
     description = row.get("description") or ""
     if is_blank_text(description):
         description = ""
-    return {
-        "id": row.get("id"),
-        "fullname": _display_full_name(first, surname, full_name_db),
-        "name": first,
-        "surname": surname,
-        "company": company,
-        "position": position,
-        "position_line": compose_position_line(position, company),
-        "description": description,
-        "photo_url": _resolve_media(row.get("photo")),
-        "company_photo_url": _resolve_media(row.get("company_photo")),
-        "website": row.get("website") or "",
-        "email": row.get("email") or "",
-        "phone": row.get("phone") or "",
-        "links": row.get("social_links") or [],
-        "sessions": row.get("sessions") or [],
-    }
-
-
-_FEATURED_CACHE = TimedCache(ttl_seconds=10.0)
-_LIST_CACHE = TimedCache(ttl_seconds=10.0)
-_PAGE_CACHE = TimedCache(ttl_seconds=10.0)
-_DETAIL_CACHE = TimedCache(ttl_seconds=10.0)
+    return SpeakerView(
+        id=row.get("id"),
+        fullname=_display_full_name(first, surname, full_name_db),
+        name=first,
+        surname=surname,
+        company=company,
+        position=position,
+        position_line=compose_position_line(position, company),
+        description=description,
+        photo_url=_resolve_media(row.get("photo")),
+        company_photo_url=_resolve_media(row.get("company_photo")),
+        website=row.get("website") or "",
+        email=row.get("email") or "",
+        phone=row.get("phone") or "",
+        links=row.get("social_links") or [],
+        sessions=row.get("sessions") or [],
+    )
+
+
+_FEATURED_CACHE = LoopCache(ttl_seconds=10.0, name="speakers.featured", intern=True)
+_LIST_CACHE = LoopCache(ttl_seconds=10.0, name="speakers.list", intern=True)
+_PAGE_CACHE = LoopCache(ttl_seconds=10.0, name="speakers.page", intern=True)
+_DETAIL_CACHE = LoopCache(ttl_seconds=10.0, name="speakers.detail", intern=True)
 
 
 def invalidate_caches() -> None:
@@ -80,7 +85,7 @@ def _site_cache_key(req: Request) -> str:
     return f"{sid}:{slug}:{lang}"
 
 
-async def get_featured_speakers(req: Request, *, limit: int = 3) -> list[dict]:
+async def get_featured_speakers(req: Request, *, limit: int = 3) -> list[SpeakerView]:
     import asyncio
     import logging
 
@@ -121,7 +126,7 @@ async def list_speakers(
     *,
     limit: Optional[int] = None,
     latest_first: bool = True,
-) -> list[dict]:
+) -> list[SpeakerView]:
     import asyncio
     import logging
 
@@ -159,7 +164,7 @@ async def list_speakers(
     return projected
 
 
-async def get_speaker(req: Request, *, speaker_id: int) -> Optional[dict]:
+async def get_speaker(req: Request, *, speaker_id: int) -> Optional[SpeakerView]:
     import asyncio
     import logging
 
@@ -201,7 +206,7 @@ async def list_speakers_page(
     page: int = 1,
     per_page: int = 9,
     latest_first: bool = True,
-) -> tuple[list[dict], int, int]:
+) -> tuple[list[SpeakerView], int, int]:
     page = max(1, int(page))
     per_page = max(1, int(per_page))
 
@@ -14,7 +14,8 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.settings import settings
 from app.models.sponsor_model import Sponsor, SponsorTier
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
+from app.utils.view_model import ViewModel
 
 TopTier = Literal["premier", "general", "diamond", "platinum"]
 ListTier = Literal["gold", "silver", "bronze"]
@@ -40,7 +41,7 @@ _TIER_CLASSES: dict[str, str] = {
     "platinum": "",
 }
 
-_PROJECTED_CACHE = TimedCache(ttl_seconds=60.0)
+_PROJECTED_CACHE = LoopCache(ttl_seconds=60.0, name="sponsors.projected", intern=True)
 
 
 def tier_label(tier: str) -> str:
@@ -88,19 +89,23 @@ def _resolve_logo_url(logo: str | None) -> str:
     return urljoin(base, path)
 
 
-def _project(sp: Sponsor) -> dict:
+class SponsorView(ViewModel):
+    __slots__ = ("id", "name", "website", "logo_url", "tier", "tier_label", "tier_class")
+
+
+def _project(sp: Sponsor) -> SponsorView | dict:
     if not sp:
         return {}
     tier_val = sp.tier.value if isinstance(sp.tier, SponsorTier) else str(sp.tier)
-    return {
-        "id": sp.id,
-        "name": sp.name,
-        "website": _normalize_website(sp.website),
-        "logo_url": _resolve_logo_url(sp.logo) or "/static/img/img_placeholder.png",
-        "tier": tier_val,
-        "tier_label": tier_label(tier_val),
-        "tier_class": tier_css_class(tier_val),
-    }
+    return SponsorView(
+        id=sp.id,
+        name=sp.name,
+        website=_normalize_website(sp.website),
+        logo_url=_resolve_logo_url(sp.logo) or "/static/img/img_placeholder.png",
+        tier=tier_val,
+        tier_label=tier_label(tier_val),
+        tier_class=tier_css_class(tier_val),
+    )
 
 
 async def _run_in_thread(fn, *args, **kwargs):
@@ -108,7 +113,7 @@ async def _run_in_thread(fn, *args, **kwargs):
     return await loop.run_in_executor(None, partial(fn, *args, **kwargs))
 
 
-def _load_projected_sync(site_id: Optional[int]) -> list[dict]:
+def _load_projected_sync(site_id: Optional[int]) -> list[SponsorView]:
     with _db_session() as db:
         stmt = select(Sponsor)
         if site_id is not None:
@@ -121,12 +126,14 @@ def _load_projected_sync(site_id: Optional[int]) -> list[dict]:
     return [_project(sp) for sp in rows]
 
 
-async def _load_projected_sponsors(site_id: Optional[int]) -> list[dict]:
+async def _load_projected_sponsors(site_id: Optional[int]) -> list[SponsorView]:
     cache_key = f"projected:{site_id or 'all'}"
     cached = _PROJECTED_CACHE.get(cache_key)
     if cached is not None:
         return cached
     rows = await _run_in_thread(_load_projected_sync, site_id)
+    # back on the loop here, so the lock-free set is safe; code that wants to
+    # fill the cache from inside the worker must use set_threadsafe() instead
     _PROJECTED_CACHE.set(cache_key, rows)
     return rows
 
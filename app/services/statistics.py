@@ -6,9 +6,9 @@ from typing import Optional
 from fastapi import Request
 
 from app.core.http import api_get
-from app.utils.timed_cache import TimedCache
+from app.utils.timed_cache import LoopCache
 
-_STATS_CACHE = TimedCache(ttl_seconds=30.0)
+_STATS_CACHE = LoopCache(ttl_seconds=30.0, name="statistics")
 
 
 def _project(payload: dict | None) -> dict:
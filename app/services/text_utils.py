@@ -1,35 +1,55 @@
 # app/services/text_utils.py
 from __future__ import annotations
 
+import re
 import string
+from functools import lru_cache
 
 # Characters treated as "no content" when a paragraph/field contains only them.
 # Covers ASCII punctuation + various dash glyphs admins paste in as placeholders.
 _BLANK_CHARS = set(string.punctuation + string.whitespace + "—–‒―•·")
+_BLANK_STR = "".join(sorted(_BLANK_CHARS))
+
+_NEWLINES = re.compile(r"\r\n?")
+_PARAGRAPH_BREAK = re.compile(r"\n{2,}")
+
+# strip_markdown() passes, in the order they apply
+_FENCED_CODE = re.compile(r"```.*?```", re.S)
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^\)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^\)]*\)")
+_HEADING_MARK = re.compile(r"(^|\n)#+\s*")
+_EMPHASIS = str.maketrans("", "", "*_~")
+_BULLET_MARK = re.compile(r"-\s+")
+_TAG = re.compile(r"<[^>]+>")
+
+# results are memoized: the agenda repeats the same people and texts many times
+_MEMO_SIZE = 4096
 
 
 def _to_unix_newlines(s: str) -> str:
-    s = (s or "")
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    while "\n\n\n" in s:
-        s = s.replace("\n\n\n", "\n\n")
-    return s
+    return _NEWLINES.sub("\n", s or "")
 
 
 def is_blank_text(s: str | None) -> bool:
     if not s:
         return True
-    return all(ch in _BLANK_CHARS for ch in s)
+    return not s.strip(_BLANK_STR)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def _paragraphs(s: str) -> tuple[str, ...]:
+    s = _to_unix_newlines(s).replace("\xa0", " ")
+    parts = (p.strip() for p in _PARAGRAPH_BREAK.split(s))
+    return tuple(p for p in parts if p and not is_blank_text(p))
 
 
 def normalize_paragraphs(s: str) -> list[str]:
-    s = _to_unix_newlines(s).replace(" ", " ")
-    parts = [p.strip() for p in s.split("\n\n")]
-    return [p for p in parts if p and not is_blank_text(p)]
+    return list(_paragraphs(s or ""))
 
 
 def split_short_and_topic(markdown_text: str) -> tuple[str, str]:
-    paras = normalize_paragraphs(markdown_text or "")
+    paras = _paragraphs(markdown_text or "")
     if not paras:
         return "", ""
     short = paras[0]
@@ -38,14 +58,46 @@ def split_short_and_topic(markdown_text: str) -> tuple[str, str]:
 
 
 def normalize_textblock(s: str) -> str:
-    paras = normalize_paragraphs(s or "")
-    return "\n\n".join(paras)
+    return "\n\n".join(_paragraphs(s or ""))
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def strip_markdown(text: str) -> str:
+    """Plain text of a Markdown snippet, whitespace collapsed to single spaces."""
+    if not text:
+        return ""
+    s = text
+    # each pass only runs when the text can contain what it removes
+    if "`" in s:
+        s = _FENCED_CODE.sub("", s)
+        s = _INLINE_CODE.sub(r"\1", s)
+    if "](" in s:
+        s = _IMAGE.sub(r"\1", s)
+        s = _LINK.sub(r"\1", s)
+    if "#" in s:
+        s = _HEADING_MARK.sub(r"\1", s)
+    # dropping every *, _ and ~ leaves "-" as the only bullet marker
+    s = s.translate(_EMPHASIS)
+    if "-" in s:
+        s = _BULLET_MARK.sub("", s)
+    if "<" in s:
+        s = _TAG.sub("", s)
+    return " ".join(s.split())
+
+
+def short_text(text: str, length: int = 240) -> str:
+    t = strip_markdown(text or "")
+    if len(t) <= length:
+        return t
+    cut = t[:length].rsplit(" ", 1)[0]
+    return cut + "…"
 
 
 def _strip_trailing_punct(s: str) -> str:
     return s.rstrip(".,;:!?·")
 
 
+@lru_cache(maxsize=_MEMO_SIZE)
 def compose_position_line(position: str | None, company: str | None) -> str:
     """Render 'position, company' but skip company when it's already spelled
     out inside position (case-insensitive). Handles the common admin mistake
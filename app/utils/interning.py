@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from app.utils.view_model import ViewModel
+
+
+class SharedList(list):
+    """
+    List stored by reference in several cache entries at once.
+    Callers slice or copy it; never mutate it in place.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+# content hash -> canonical object; entries vanish once no cache holds them
+_POOL: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+_STATS = {"hits": 0, "misses": 0, "collisions": 0}
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, ViewModel):
+        return (type(value), *(_freeze(getattr(value, f)) for f in value._fields))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if value is not None and type(value).__hash__ is object.__hash__:
+        # identity-hashed objects say nothing about their contents
+        raise TypeError(f"cannot hash contents of {type(value).__name__}")
+    return value
+
+
+def content_hash(value: Any) -> int:
+    """
+    Hash of a value's contents (views, lists, dicts and scalars, nested).
+    Raises TypeError when something inside cannot be hashed.
+    """
+    return hash(_freeze(value))
+
+
+def _view_hash(view: ViewModel) -> int:
+    return hash(_freeze(view))
+
+
+def _same_view(a: ViewModel, b: ViewModel) -> bool:
+    if type(a) is not type(b):
+        return False
+    for f in a._fields:
+        x, y = getattr(a, f), getattr(b, f)
+        if x is not y and (type(x) is not type(y) or x != y):
+            return False
+    return True
+
+
+def _same_list(a: list, b: list) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def _pooled(key: int, value: Any, same) -> Any:
+    existing = _POOL.get(key)
+    if existing is None:
+        _STATS["misses"] += 1
+        _POOL[key] = value
+        return value
+    if same(existing, value):
+        _STATS["hits"] += 1
+        return existing
+    _STATS["collisions"] += 1
+    return value
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Return a canonical, shared instance equal to `value`.
+
+    ViewModels are keyed by a hash of their field contents; lists are keyed by
+    the identities of their (already interned) items, so overlapping slices and
+    per-lang copies of the same rows end up pointing at one set of objects.
+    Tuples are rebuilt around interned members. Anything else (plain dicts,
+    scalars) is returned unchanged.
+    """
+    if isinstance(value, ViewModel):
+        try:
+            key = _view_hash(value)
+        except TypeError:
+            return value
+        return _pooled(key, value, _same_view)
+    if isinstance(value, list):
+        items = [intern_value(v) for v in value]
+        if not all(isinstance(v, ViewModel) for v in items):
+            return value
+        key = hash(("list", *map(id, items)))
+        return _pooled(key, SharedList(items), _same_list)
+    if isinstance(value, tuple):
+        return tuple(intern_value(v) for v in value)
+    return value
+
+
+def interning_stats() -> dict:
+    return {"pooled": len(_POOL), **_STATS}
@@ -1,43 +1,226 @@
 from __future__ import annotations
 
+import asyncio
+import sys
 import time
+from contextlib import nullcontext
 from threading import RLock
-from typing import Dict, Generic, Optional, Tuple, TypeVar
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+from app.utils.interning import intern_value, interning_stats
 
 T = TypeVar("T")
 
+# Upper bounds (seconds) of the entry-age histogram buckets reported by stats().
+AGE_BUCKETS: Tuple[float, ...] = (1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+_REGISTRY: Dict[str, "TimedCache"] = {}
+
+
+def _deep_sizeof(obj: Any, seen: set[int]) -> int:
+    oid = id(obj)
+    if oid in seen:
+        return 0
+    seen.add(oid)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _deep_sizeof(k, seen) + _deep_sizeof(v, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for it in obj:
+            size += _deep_sizeof(it, seen)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_sizeof(vars(obj), seen)
+    elif hasattr(obj, "__slots__"):
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                size += _deep_sizeof(getattr(obj, slot), seen)
+    return size
+
+
+def _age_label(idx: int) -> str:
+    if idx < len(AGE_BUCKETS):
+        return f"<={AGE_BUCKETS[idx]:g}s"
+    return f">{AGE_BUCKETS[-1]:g}s"
+
 
 class TimedCache(Generic[T]):
     """
     Small in-memory cache with per-key TTL.
     Intended for data that is expensive to fetch but tolerates slight staleness.
+
+    Named caches register themselves so /internal/cache/stats can report
+    hit ratios, sizes and entry ages across all of them. With intern=True,
+    stored values go through intern_value() so equal items and lists are
+    kept once and shared by reference across keys and caches. With
+    max_entries the oldest insertion is evicted first; lru=True makes a hit
+    count as an insertion, so the least recently used entry goes instead.
     """
 
-    def __init__(self, ttl_seconds: float = 30.0):
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        *,
+        name: Optional[str] = None,
+        intern: bool = False,
+        max_entries: Optional[int] = None,
+        lru: bool = False,
+    ):
         self.ttl = float(ttl_seconds)
+        self.name = name
+        self.intern = intern
+        self.max_entries = max_entries
+        self.lru = lru
         self._lock = RLock()
         self._store: Dict[str, Tuple[float, T]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        if name:
+            _REGISTRY[name] = self
+
+    def _lookup(self, key: str) -> Optional[T]:
+        entry = self._store.get(key)
+        if not entry:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at > time.monotonic():
+            self.hits += 1
+            if self.lru:
+                # re-insert so eviction order follows use
+                self._store[key] = self._store.pop(key)
+            return value
+        # expired
+        self._store.pop(key, None)
+        self.misses += 1
+        self.evictions += 1
+        return None
+
+    def _put(self, key: str, value: T) -> None:
+        if self.intern:
+            value = intern_value(value)
+        if self.max_entries and key not in self._store and len(self._store) >= self.max_entries:
+            # oldest insertion goes first
+            self._store.pop(next(iter(self._store)))
+            self.evictions += 1
+        self._store[key] = (time.monotonic() + self.ttl, value)
+        self.sets += 1
 
     def get(self, key: str) -> Optional[T]:
-        now = time.monotonic()
         with self._lock:
-            entry = self._store.get(key)
-            if not entry:
-                return None
-            expires_at, value = entry
-            if expires_at > now:
-                return value
-            # expired
-            self._store.pop(key, None)
-            return None
+            return self._lookup(key)
 
     def set(self, key: str, value: T) -> None:
         with self._lock:
-            self._store[key] = (time.monotonic() + self.ttl, value)
+            self._put(key, value)
 
     def invalidate(self, key: Optional[str] = None) -> None:
         with self._lock:
             if key is None:
+                self.evictions += len(self._store)
                 self._store.clear()
-            else:
-                self._store.pop(key, None)
+            elif self._store.pop(key, None) is not None:
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """Counters plus a point-in-time view of the live entries."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._store.values())
+            hits, misses, sets, evictions = self.hits, self.misses, self.sets, self.evictions
+
+        ages = [0] * (len(AGE_BUCKETS) + 1)
+        live = 0
+        seen: set[int] = set()
+        size = 0
+        for expires_at, value in entries:
+            if expires_at <= now:
+                continue
+            live += 1
+            age = now - (expires_at - self.ttl)
+            idx = 0
+            while idx < len(AGE_BUCKETS) and age > AGE_BUCKETS[idx]:
+                idx += 1
+            ages[idx] += 1
+            size += _deep_sizeof(value, seen)
+
+        lookups = hits + misses
+        return {
+            "ttl_seconds": self.ttl,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "sets": sets,
+            "evictions": evictions,
+            "entries": live,
+            "expired_pending": len(entries) - live,
+            "approx_bytes": size,
+            "age_histogram": {_age_label(i): n for i, n in enumerate(ages)},
+        }
+
+
+class LoopCache(TimedCache[T]):
+    """
+    TimedCache variant for state owned by the event loop.
+
+    get/set run without locking: the loop is single-threaded and neither
+    method awaits, so they cannot interleave. Code running in an executor
+    thread must not call get/set directly; it hands results back with
+    set_threadsafe(), which schedules the write on the owning loop.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        *,
+        name: Optional[str] = None,
+        intern: bool = False,
+        max_entries: Optional[int] = None,
+        lru: bool = False,
+    ):
+        super().__init__(ttl_seconds, name=name, intern=intern, max_entries=max_entries, lru=lru)
+        self._lock = nullcontext()
+
+    get = TimedCache._lookup
+    set = TimedCache._put
+
+    def set_threadsafe(self, key: str, value: T, loop: asyncio.AbstractEventLoop) -> None:
+        loop.call_soon_threadsafe(self._put, key, value)
+
+
+def registered_caches() -> Dict[str, TimedCache]:
+    return dict(_REGISTRY)
+
+
+def invalidate_registered(prefix: Optional[str] = None) -> list[str]:
+    """
+    Clear every registered cache, or only those named `prefix` / `prefix.*`.
+    Returns the names that were cleared.
+    """
+    cleared = []
+    for name, cache in list(_REGISTRY.items()):
+        if prefix is None or name == prefix or name.startswith(prefix + "."):
+            cache.invalidate()
+            cleared.append(name)
+    return cleared
+
+
+def cache_stats() -> dict:
+    caches = {name: cache.stats() for name, cache in sorted(_REGISTRY.items())}
+    hits = sum(c["hits"] for c in caches.values())
+    misses = sum(c["misses"] for c in caches.values())
+    return {
+        "caches": caches,
+        "totals": {
+            "caches": len(caches),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if (hits + misses) else None,
+            "entries": sum(c["entries"] for c in caches.values()),
+            "approx_bytes": sum(c["approx_bytes"] for c in caches.values()),
+        },
+        "interning": interning_stats(),
+    }
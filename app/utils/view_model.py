@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class ViewModel(Mapping):
+    """
+    Frozen, slotted record for projected rows kept in caches.
+
+    Subclasses list their fields in __slots__. Instances read like the dicts
+    they replace: attribute access (`sp.name`), item access (`sp["name"]`),
+    `.get()`, iteration over keys and `dict(sp)` all work, so templates and
+    callers need no changes. They are read-only; build a new one instead.
+    """
+
+    __slots__ = ("__weakref__",)
+    _fields: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields: list[str] = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name != "__weakref__" and name not in fields:
+                    fields.append(name)
+        cls._fields = tuple(fields)
+        cls._field_set = frozenset(fields)
+
+    def __init__(self, **values: Any):
+        setter = object.__setattr__
+        for name in self._fields:
+            try:
+                setter(self, name, values.pop(name))
+            except KeyError:
+                raise TypeError(f"{type(self).__name__} missing field {name!r}") from None
+        if values:
+            raise TypeError(f"{type(self).__name__} got unexpected fields {sorted(values)!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._field_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        return default
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __repr__(self) -> str:
+        inner = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({inner})"
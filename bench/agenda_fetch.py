@@ -0,0 +1,71 @@
+"""
+Agenda composition over the whole-agenda endpoint vs the per-day fan-out.
+
+    python -m bench.agenda_fetch
+    STUB_DAYS=5 STUB_LATENCY_MS=40 python -m bench.agenda_fetch
+
+Runs list_days_with_episode_views() against bench.stub_backend in-process
+(through httpx's ASGI transport, with the stub's simulated latency), once
+with /agenda/full available and once with it answering 404. Reports backend
+requests and wall time per build, and exits non-zero if the two ways
+compose different agendas.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import httpx
+from starlette.requests import Request
+
+from app.services import agenda
+from app.services.episodes import list_days_with_episode_views
+from bench import stub_backend
+
+ROUNDS = 20
+
+
+def _request(client: httpx.AsyncClient) -> Request:
+    app = SimpleNamespace(state=SimpleNamespace(http=client))
+    return Request({"type": "http", "method": "GET", "path": "/agenda", "headers": [], "query_string": b"", "app": app})
+
+
+async def _run(whole: bool) -> tuple[list[dict], Counter, float]:
+    stub_backend.WHOLE_AGENDA = whole
+    agenda._whole_unsupported_until = 0.0
+    paths: Counter = Counter()
+
+    async def count(request: httpx.Request) -> None:
+        paths[request.url.path] += 1
+
+    transport = httpx.ASGITransport(app=stub_backend.app)
+    async with httpx.AsyncClient(transport=transport, event_hooks={"request": [count]}) as client:
+        req = _request(client)
+        result = await list_days_with_episode_views(req)  # warm-up; learns whether /agenda/full exists
+        paths.clear()
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            await list_days_with_episode_views(req)
+        took = (time.perf_counter() - started) / ROUNDS
+    for path in paths:
+        paths[path] //= ROUNDS
+    return result, paths, took
+
+
+async def main() -> int:
+    whole, whole_paths, whole_took = await _run(True)
+    fan_out, fan_out_paths, fan_out_took = await _run(False)
+    print(f"days: {stub_backend.DAYS}  episodes/day: {stub_backend.EPISODES_PER_DAY}  latency: {stub_backend.LATENCY * 1000:.0f} ms")
+    for label, paths, took in (("whole agenda", whole_paths, whole_took), ("per-day fan-out", fan_out_paths, fan_out_took)):
+        print(f"{label}: {sum(paths.values())} requests per build, {took * 1000:.1f} ms")
+    print(f"fetch paths: {agenda.fetch_path_stats()}")
+    same = whole == fan_out
+    print("composed agendas identical" if same else "MISMATCH between whole-agenda and per-day results")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,66 @@
+"""
+Per-lookup cost of TimedCache (RLock) vs LoopCache (lock-free on the loop).
+
+    python -m bench.cache_lookup
+
+A home page render performs roughly HOME_LOOKUPS cache reads (sponsor
+projections are read six times by get_homepage_bundle, plus one read per
+speakers/sectors/news/organizers/partners/participants/statistics call).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import timeit
+
+from app.utils.timed_cache import LoopCache, TimedCache
+
+HOME_LOOKUPS = 14
+KEYS = [f"list:10:main:{lang}:{n}" for lang in ("en", "ru", "tk", "zh") for n in range(8)]
+ROUNDS = 200_000
+
+
+def _fill(cache: TimedCache) -> None:
+    for k in KEYS:
+        cache.set(k, [k])
+
+
+def _bench(cache: TimedCache) -> float:
+    _fill(cache)
+    get = cache.get
+    keys = KEYS * (ROUNDS // len(KEYS))
+
+    def run():
+        for k in keys:
+            get(k)
+
+    best = min(timeit.repeat(run, number=1, repeat=5))
+    return best / len(keys) * 1e9
+
+
+def _handoff_check() -> None:
+    cache: LoopCache[list] = LoopCache(ttl_seconds=60.0)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        t = threading.Thread(target=cache.set_threadsafe, args=("k", [1], loop))
+        t.start()
+        t.join()
+        await asyncio.sleep(0)
+        assert cache.get("k") == [1], "set_threadsafe did not land on the loop"
+
+    asyncio.run(main())
+
+
+def main() -> None:
+    locked = _bench(TimedCache(ttl_seconds=60.0))
+    free = _bench(LoopCache(ttl_seconds=60.0))
+    _handoff_check()
+    print(f"{'variant':<12}{'ns/lookup':>12}{'ns/home page':>16}")
+    print(f"{'TimedCache':<12}{locked:>12.1f}{locked * HOME_LOOKUPS:>16.1f}")
+    print(f"{'LoopCache':<12}{free:>12.1f}{free * HOME_LOOKUPS:>16.1f}")
+    print(f"speedup: {locked / free:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Differential check and timing of the Markdown fast path (render_simple)
+against Python-Markdown.
+
+    python -m bench.markdown_fast_path
+    BENCH_LIVE=1 python -m bench.markdown_fast_path   # add backend content
+
+Every document is normalized the way markdown_render does it, then rendered
+both ways; any document the fast path accepts must come out byte-identical.
+The corpus is the sample bios below, generated combinations of the
+constructs the fast path has to get right or refuse, and with BENCH_LIVE=1
+every participant bio and sector description the configured backend
+returns in each supported language. Exits non-zero on a mismatch.
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import timeit
+
+import httpx
+
+from app.core.settings import settings
+from app.services.markdown_render import _renderer, normalize_markdown
+from app.services.markdown_simple import render_simple
+
+SAMPLES = [
+    "Bio text\n\nMore",
+    "# Title\nIntro para: - a - b\n\nMore **bold** text.\nline2",
+    "Founded in 1998, the company operates hotels across the region.\n\nServices: - Hotels - Tours - Transfers",
+    "Ministry of Tourism & Sports\n\nResponsible for:\n- policy\n- international cooperation\n- events",
+    "## About\nWe build resorts.\n\n## Projects\n- Avaza resort\n- Caspian marina\n\nContact us for details.",
+    "Компания основана в 2005 году.\n\nНаправления: - туризм - гостиничный бизнес",
+    "Türkmenistanyň syýahatçylyk pudagy.\nTäze taslamalar.",
+    "旅游公司\n\n- 酒店\n- 旅行",
+    "Deputy Minister, responsible for the sector since 2019. Speaks at C# and .NET events.",
+    "Our team: - 40 guides - 12 languages\nAvailable all year.",
+    "1. First\n2. Second",
+    "Visit <a href='x'>site</a> &amp; more",
+    "Price list | item | cost",
+    "Term\n: definition",
+    "Line with trailing spaces  \nnext",
+    "    indented code",
+]
+
+# what the fast path must render exactly (including toc id clashes and the
+# headings normalize_markdown makes out of "## " and "C# ")
+_SIMPLE = [
+    "Plain sentence", "Another line of text", "A & B Ltd", "Ask: - one - two", "a - b - c", "x -- y",
+    "# Head", "## Sub head", "### Третий", "#5 thing", "#", "# Intro", "Intro", "# intro_1",
+    "- item", "- item with text", "C# developer", "Ends with colon:", "12 months", "100% (ok)?", "“quoted”",
+]
+# what it must refuse
+_OTHER = [
+    "Tom &amp; Jerry", "####### seven", "## Trailing ##", "-dash start", "- - nested", "---", "===", "2024. Year",
+    ": def", "+ plus", "  lead space", "trail space ", "\ttab", "**bold**", "_under_", "`code`", "[link](u)", "<b>",
+    "&#1 ?", "x &#12 y", "a &1x; b", "&#x41", "&#;", "&#65;", "&copy;", "R&D;",
+]
+
+
+def _generated(n: int, fragments: list[str], seed: int = 7) -> list[str]:
+    rnd = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rnd.randint(1, 8)):
+            parts.append(rnd.choice(fragments))
+            parts.append(rnd.choice(["\n", "\n\n", " ", "\n\n\n", "\r\n"]))
+        docs.append("".join(parts))
+    return docs
+
+
+def _live() -> list[str]:
+    texts = []
+    base = settings.BACKEND_BASE_URL.rstrip("/")
+    with httpx.Client(timeout=10.0) as client:
+        for lang in settings.SUPPORTED_LANGS:
+            for path, fields in (("/participants/", ("bio",)), ("/expo-sectors/", ("description", "extended_description"))):
+                try:
+                    rows = client.get(base + path, params={"lang": lang}).json()
+                except Exception as exc:
+                    print(f"live {path} [{lang}] skipped: {exc!r}")
+                    continue
+                rows = rows.get("items", []) if isinstance(rows, dict) else rows
+                texts += [r[f] for r in rows if isinstance(r, dict) for f in fields if r.get(f)]
+    return texts
+
+
+def _full(norm: str) -> str:
+    return _renderer().reset().convert(norm)
+
+
+def main() -> int:
+    corpus = SAMPLES + _generated(4000, _SIMPLE) + _generated(4000, _SIMPLE + _OTHER)
+    if os.environ.get("BENCH_LIVE"):
+        live = _live()
+        print(f"live documents: {len(live)}")
+        corpus += live
+
+    fast_docs, mismatches = [], 0
+    for doc in corpus:
+        norm = normalize_markdown(doc)
+        fast = render_simple(norm)
+        if fast is None:
+            continue
+        fast_docs.append(norm)
+        if fast != _full(norm):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"MISMATCH {doc!r}\n  fast: {fast!r}\n  full: {_full(norm)!r}")
+    print(f"documents: {len(corpus)}  fast path: {len(fast_docs)} ({len(fast_docs) / len(corpus):.0%})  mismatches: {mismatches}")
+
+    sample = fast_docs[:500]
+    full = min(timeit.repeat(lambda: [_full(d) for d in sample], number=1, repeat=5)) / len(sample)
+    fast = min(timeit.repeat(lambda: [render_simple(d) for d in sample], number=1, repeat=5)) / len(sample)
+    print(f"per document: Python-Markdown {full * 1e6:.1f} µs, fast path {fast * 1e6:.1f} µs ({full / fast:.0f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
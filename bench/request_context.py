@@ -0,0 +1,124 @@
+"""
+Per-request overhead of RequestContextMiddleware against the two
+BaseHTTPMiddleware layers it replaced (site resolver + language).
+
+    python -m bench.request_context
+
+Both stacks wrap the same trivial endpoint and are driven through ASGI
+directly, so the numbers are middleware cost only. The old layers are
+copied below. Every sample request must get the same request.state.site,
+request.state.lang and Set-Cookie from both stacks; exits non-zero if not.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.request_context import LANG_COOKIE, RequestContextMiddleware, _normalize_lang
+from app.core.settings import settings
+from app.core.site_resolver import resolve_site
+
+ROUNDS = 5000
+
+
+class _OldSiteResolverMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request.state.site = resolve_site(request)
+        return await call_next(request)
+
+
+class _OldLanguageMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        q = request.query_params.get("lang")
+        c = request.cookies.get(LANG_COOKIE)
+        al = (request.headers.get("accept-language") or "").split(",")[0] or ""
+        lang = _normalize_lang(q or c or al)
+
+        request.state.lang = lang
+        response = await call_next(request)
+
+        if c != lang:
+            response.set_cookie(LANG_COOKIE, lang, max_age=60 * 60 * 24 * 365, samesite="lax")
+        return response
+
+
+async def _endpoint(request: Request) -> PlainTextResponse:
+    site = request.state.site
+    return PlainTextResponse(f"{site.id}|{site.slug}|{site.host}|{request.state.lang}")
+
+
+def _app(middleware: list[Middleware]) -> Starlette:
+    return Starlette(routes=[Route("/", _endpoint, methods=["GET", "POST"])], middleware=middleware)
+
+
+OLD = _app([Middleware(_OldLanguageMiddleware), Middleware(_OldSiteResolverMiddleware)])
+NEW = _app([Middleware(RequestContextMiddleware)])
+
+SAMPLES = [
+    ("GET", [(b"host", b"main.local")], b""),
+    ("GET", [(b"host", b"main.local:8000"), (b"accept-language", b"ru-RU,ru;q=0.9,en;q=0.8")], b""),
+    ("GET", [(b"host", b"testserver"), (b"cookie", b"lang=tk; other=1")], b""),
+    ("GET", [(b"host", b"testserver"), (b"cookie", b"lang=zh")], b"lang=ru"),
+    ("GET", [(b"host", b"proxy"), (b"x-forwarded-host", b"Main.Local, proxy")], b""),
+    ("GET", [(b"host", b"proxy"), (b"forwarded", b"for=1.2.3.4;host=testserver;proto=https")], b""),
+    ("GET", [(b"host", b"main.local"), (b"x-site-slug", b"site-b")], b"__site_id=7&lang="),
+    ("GET", [(b"host", b"unknown.example")], b"__site=main&lang=xx"),
+    ("POST", [(b"host", b"main.local"), (b"x-site-id", b"3")], b"__site=site-b"),
+    ("GET", [(b"host", b"main.local"), (b"accept-language", b"zh-CN")], b"lang=en&lang=tk"),
+]
+
+
+async def _call(app: Starlette, method: str, headers: list, query: bytes) -> tuple:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": "/", "raw_path": b"/", "root_path": "", "query_string": query, "headers": headers,
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    sent: list = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    start = sent[0]
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    cookies = sorted(v for k, v in start["headers"] if k == b"set-cookie")
+    return start["status"], body, cookies
+
+
+async def main() -> int:
+    settings.SITE_MAP_RAW = "main.local:main:10,testserver:site-b:2"
+    settings.ALLOW_SITE_OVERRIDE = True
+
+    mismatches = 0
+    for sample in SAMPLES:
+        old, new = await _call(OLD, *sample), await _call(NEW, *sample)
+        if old != new:
+            mismatches += 1
+            print(f"MISMATCH {sample}\n  old: {old}\n  new: {new}")
+    print(f"samples: {len(SAMPLES)}  mismatches: {mismatches}")
+
+    for label, app in (("BaseHTTPMiddleware x2", OLD), ("RequestContextMiddleware", NEW)):
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for i in range(ROUNDS):
+                await _call(app, *SAMPLES[i % len(SAMPLES)])
+            best = min(best, time.perf_counter() - started)
+        print(f"{label}: {best / ROUNDS * 1e6:.1f} µs per request (endpoint included)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
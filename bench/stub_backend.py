@@ -0,0 +1,171 @@
+"""
+Stand-in for the content backend, for benchmarks and local runs without one.
+
+    uvicorn bench.stub_backend:app --port 8001
+
+Serves generated data on the paths the front end reads, including the
+agenda both ways: /agenda/days plus /agenda/day/{id}/episodes, and the
+whole agenda from /agenda/full. Sizes and latency come from the
+environment:
+
+    STUB_DAYS=3 STUB_EPISODES_PER_DAY=8 STUB_SPEAKERS=120
+    STUB_LATENCY_MS=20     added to every response
+    STUB_WHOLE_AGENDA=0    answer /agenda/full with 404, like an older backend
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+
+from fastapi import FastAPI, HTTPException
+
+DAYS = int(os.environ.get("STUB_DAYS", "3"))
+EPISODES_PER_DAY = int(os.environ.get("STUB_EPISODES_PER_DAY", "8"))
+SPEAKERS = int(os.environ.get("STUB_SPEAKERS", "120"))
+LATENCY = float(os.environ.get("STUB_LATENCY_MS", "20")) / 1000
+# module-level so benchmarks can switch the endpoint off and on in-process
+WHOLE_AGENDA = os.environ.get("STUB_WHOLE_AGENDA", "1") not in ("0", "false", "no")
+
+app = FastAPI()
+
+
+@app.middleware("http")
+async def _latency(request, call_next):
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+    return await call_next(request)
+
+
+def _episode_id(day_id: int, n: int) -> int:
+    return 100 + (day_id - 1) * EPISODES_PER_DAY + n
+
+
+def _days() -> list[dict]:
+    return [{"id": d, "date": f"2025-10-{d:02d}", "label": f"Day {d}", "published": True, "sort_order": d} for d in range(1, DAYS + 1)]
+
+
+def _episodes(day_id: int) -> list[dict]:
+    return [
+        {
+            "id": _episode_id(day_id, n),
+            "day_id": day_id,
+            "title": f"Session {n + 1}, day {day_id}",
+            "slug": f"session-{day_id}-{n + 1}",
+            "description_md": "Short description of the session.\n\nTopics: - markets - investment\n\nClosing **remarks**.",
+            "start_time": f"2025-10-{day_id:02d}T{9 + n % 9:02d}:00:00",
+            "end_time": f"2025-10-{day_id:02d}T{10 + n % 9:02d}:00:00",
+            "location": f"Hall {'ABC'[n % 3]}",
+            "sponsors": [{"id": 1 + n % 4, "name": f"Sponsor {1 + n % 4}", "logo": "sponsors/logo.png", "tier": "Gold"}] if n % 2 else [],
+        }
+        for n in range(EPISODES_PER_DAY)
+    ]
+
+
+def _speakers() -> list[dict]:
+    total = DAYS * EPISODES_PER_DAY
+    return [
+        {
+            "id": i,
+            "name": f"Name{i}",
+            "surname": f"Surname{i}",
+            "company": f"Company {i % 15}",
+            "position": "Director",
+            "description": "Biography paragraph.\n\n- first role\n- second role",
+            "photo": f"speakers/{i}.jpg",
+            "sessions": [{"id": 100 + i % total}, {"id": 100 + (i * 7) % total}],
+        }
+        for i in range(1, SPEAKERS + 1)
+    ]
+
+
+def _moderators() -> list[dict]:
+    total = DAYS * EPISODES_PER_DAY
+    return [
+        {"id": i, "name": f"Moderator {i}", "description": "Moderator *bio*", "photo": "moderators/m.jpg", "episodes": [100 + i % total]}
+        for i in range(1, total + 1)
+    ]
+
+
+@app.get("/agenda/days")
+def agenda_days():
+    return _days()
+
+
+@app.get("/agenda/day/{day_id}/episodes")
+def agenda_day_episodes(day_id: int):
+    return _episodes(day_id) if 1 <= day_id <= DAYS else []
+
+
+@app.get("/agenda/full")
+def agenda_full():
+    if not WHOLE_AGENDA:
+        raise HTTPException(status_code=404)
+    return [{**day, "episodes": _episodes(day["id"])} for day in _days()]
+
+
+@app.get("/speakers/")
+def speakers():
+    return _speakers()
+
+
+@app.get("/speakers/{speaker_id}")
+def speaker(speaker_id: int):
+    for row in _speakers():
+        if row["id"] == speaker_id:
+            return row
+    raise HTTPException(status_code=404)
+
+
+@app.get("/moderators/")
+def moderators():
+    return _moderators()
+
+
+@app.get("/participants/")
+def participants():
+    return [{"id": i, "name": f"Participant {i}", "role": ("expo", "forum", "both", "gov")[i % 4], "bio": "Bio text\n\nMore", "logo": "participants/l.png"} for i in range(1, 60)]
+
+
+@app.get("/participants/{participant_id}")
+def participant(participant_id: int):
+    return {"id": participant_id, "name": f"Participant {participant_id}", "role": "expo", "bio": "# About\nIntro: - one - two\n\nMore **bold** text.", "images": [{"path": "participants/a.png"}]}
+
+
+@app.get("/news/")
+def news(skip: int = 0, limit: int = 5):
+    return [{"id": i, "header": f"News {i}", "description": "Summary", "photo": "news/n.png", "created_at": f"2025-09-{i:02d}T10:00:00"} for i in range(1, 20)][skip:skip + limit]
+
+
+@app.get("/news/{news_id}")
+def news_item(news_id: int):
+    return {"id": news_id, "header": f"News {news_id}", "description": "Summary", "body": "Body", "created_at": "2025-09-01T10:00:00"}
+
+
+@app.get("/faq")
+def faq(limit: int | None = None):
+    return [{"id": i, "question": f"Question {i}?", "answer_md": f"Answer {i}"} for i in range(1, 8)][: limit or 100]
+
+
+@app.get("/expo-sectors/")
+def expo_sectors():
+    return [{"id": i, "header": f"Sector {i}", "description": "Description", "logo": "sectors/s.png"} for i in range(1, 10)]
+
+
+@app.get("/expo-sectors/{sector_id}")
+def expo_sector(sector_id: int):
+    return {"id": sector_id, "header": f"Sector {sector_id}", "description": "Intro\n\nMore", "extended_description": "## Overview\nText - one - two\n\n- three", "images": [{"path": "sectors/a.png"}]}
+
+
+@app.get("/organizers/")
+def organizers():
+    return [{"id": i, "name": f"Organizer {i}", "logo": "organizers/o.png"} for i in range(1, 4)]
+
+
+@app.get("/partners/")
+def partners():
+    return [{"id": i, "name": f"Partner {i}", "logo": "partners/p.png"} for i in range(1, 4)]
+
+
+@app.get("/statistics/")
+def statistics():
+    return {"episodes": DAYS * EPISODES_PER_DAY, "delegates": 200, "speakers": SPEAKERS, "companies": 59}
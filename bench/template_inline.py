@@ -0,0 +1,133 @@
+"""
+Render time of index.html and agenda.html with t() resolved at render time
+(theme environment) vs compiled in (environment specialised per theme/lang).
+
+    ENV=prod python -m bench.template_inline
+
+Data is synthetic but shaped like the service output the routes pass in.
+Fragment caching is switched off so every render does the full work. The
+t() column counts calls left at render time; timings are best of REPEAT.
+(ENV=dev adds a locale mtime check to t() calls made without a request.)
+"""
+from __future__ import annotations
+
+import timeit
+from datetime import datetime, timedelta
+
+from jinja2 import pass_context
+from starlette.requests import Request
+
+from app.core.settings import settings
+from app.core.site_resolver import SiteInfo
+from app.core.templates import specialized_env, theme_env
+from app.main import app
+from app.routers.site import _resolve_home_limits
+from app.services import episodes, news, speakers
+from app.services import timer as timer_srv
+
+ROUNDS = 20
+REPEAT = 15
+TARGETS = [("", "en"), ("", "ru"), ("site-b", "en"), ("site-b", "ru")]
+
+
+def _request(slug: str, lang: str) -> Request:
+    req = Request({
+        "type": "http", "method": "GET", "scheme": "http", "path": "/", "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"testserver")], "server": ("testserver", 80),
+        "app": app, "router": app.router,
+    })
+    req.state.site = SiteInfo(id=2 if slug else 10, slug=slug, host="testserver")
+    req.state.lang = lang
+    return req
+
+
+def _person(i: int) -> dict:
+    return {"id": i, "name": f"Name{i}", "surname": f"Surname{i}", "position": "Deputy Minister",
+            "company": "Ministry of Tourism", "description": "Speaker biography paragraph. " * 4, "photo": f"p/{i}.jpg"}
+
+
+def _index_ctx(req: Request) -> dict:
+    sp = [speakers._row_to_dict({**_person(i), "sessions": []}) for i in range(8)]
+    items = [news._row_to_card({"id": i, "header": f"Headline {i}", "description": "Summary. " * 4,
+                                "photo": f"n/{i}.jpg", "created_at": "2025-09-01T10:00:00"}) for i in range(5)]
+    empty = {"items": [], "count": 0, "layout": "empty", "rows": [], "marquee_rows": []}
+    return {
+        "request": req, "lang": req.state.lang, "settings": settings,
+        "sponsors_top_view": {"items": [], "count": 0, "layout": "empty", "max": 5},
+        "gold": empty, "silver": empty, "bronze": empty, "show_sponsor_tiers": True,
+        "stats": {"episodes": 10, "delegates": 200, "speakers": 39, "companies": 59},
+        "sectors": [], "sectors_data": {"items": []},
+        "news": items, "news_data": {"items": items},
+        "faqs": [{"id": i, "question": f"Question {i}?", "answer_md": "Answer."} for i in range(6)],
+        "speakers": sp, "speakers_data": {"items": sp},
+        "organizers": [], "organizers_data": {"items": []}, "partners": [], "partners_data": {"items": []},
+        "limits": _resolve_home_limits(req),
+        "timer": timer_srv.build_timer_context(timer_srv.get_deadline_from_settings(settings)),
+    }
+
+
+def _agenda_ctx(req: Request) -> dict:
+    start = datetime(2025, 10, 1, 9, 0)
+    days = []
+    for d in range(3):
+        eps = []
+        for j in range(6):
+            at = start + timedelta(days=d, hours=j)
+            people = [episodes._flatten_person_like(_person(d * 10 + j + k)) for k in range(3)]
+            for p in people:
+                p["description_norm"] = p["description"]
+            eps.append({
+                "id": d * 10 + j, "slug": f"ep-{d}-{j}", "title": f"Session {j}", "description_md": "Short.\n\nTopic.",
+                "short_desc": "Short.", "topic_desc": "Topic.", "start_time": at, "end_time": at + timedelta(minutes=50),
+                "location": "Hall A", "speakers": people, "moderators": people[:1], "first_moderator": people[0],
+                "sponsors": [], "top_sponsor": None,
+            })
+        days.append({"id": d + 1, "date": (start + timedelta(days=d)).date(), "episodes": eps})
+    return {"request": req, "lang": req.state.lang, "settings": settings, "days": days, "selected_day_id": 1}
+
+
+def _time_pair(a, b, ctx: dict) -> tuple[float, float]:
+    # interleaved so drift on a busy machine hits both sides alike
+    a.render(ctx)
+    b.render(ctx)
+    best_a = best_b = float("inf")
+    for _ in range(REPEAT):
+        best_a = min(best_a, timeit.timeit(lambda: a.render(ctx), number=ROUNDS))
+        best_b = min(best_b, timeit.timeit(lambda: b.render(ctx), number=ROUNDS))
+    return best_a / ROUNDS * 1000, best_b / ROUNDS * 1000
+
+
+def _count_t_calls(env, name: str, ctx: dict) -> int:
+    # fresh overlay: modules imported without context keep the t they were built with
+    t = env.globals["t"]
+    calls = 0
+
+    @pass_context
+    def counting(c, key):
+        nonlocal calls
+        calls += 1
+        return t(c, key)
+
+    counting_env = env.overlay(cache_size=0)
+    counting_env.globals = {**env.globals, "t": counting}
+    counting_env.get_template(name).render(ctx)
+    return calls
+
+
+def main() -> None:
+    settings.FRAGMENT_CACHE_ENABLED = False
+    print(f"{'page':<13}{'theme/lang':<12}{'t() calls':>14}{'t() ms':>9}{'inlined ms':>12}{'saved':>8}")
+    for page, build in (("index.html", _index_ctx), ("agenda.html", _agenda_ctx)):
+        for slug, lang in TARGETS:
+            req = _request(slug, lang)
+            ctx = build(req)
+            base_env, env = theme_env(slug), specialized_env(slug, lang)
+            plain, special = base_env.get_template(page), env.get_template(page)
+            calls = f"{_count_t_calls(base_env, page, ctx)} -> {_count_t_calls(env, page, ctx)}"
+            base, inlined = _time_pair(plain, special, ctx)
+            target = (slug or "base") + "/" + lang
+            print(f"{page:<13}{target:<12}{calls:>14}{base:>9.2f}{inlined:>12.2f}{1 - inlined / base:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
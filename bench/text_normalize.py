@@ -0,0 +1,118 @@
+"""
+Parity check and timing of the text_utils cleanup helpers against the
+implementations they replaced.
+
+    python -m bench.text_normalize
+
+The references below are the previous episodes._strip_md / _short_text and
+text_utils.normalize_paragraphs, copied verbatim. Every document of a
+generated corpus (Markdown constructs, odd whitespace, placeholder-only
+paragraphs) must give identical output. Exits non-zero on a mismatch.
+"""
+from __future__ import annotations
+
+import random
+import re
+import string
+import sys
+import timeit
+
+from app.services import text_utils
+from app.services.text_utils import normalize_paragraphs, short_text, strip_markdown
+
+_BLANK_CHARS = set(string.punctuation + string.whitespace + "—–‒―•·")
+
+
+def _ref_strip_md(text: str) -> str:
+    if not text:
+        return ""
+    s = text
+    s = re.sub(r"```.*?```", "", s, flags=re.S)
+    s = re.sub(r"`([^`]*)`", r"\1", s)
+    s = re.sub(r"!\[([^\]]*)\]\([^\)]*\)", r"\1", s)
+    s = re.sub(r"\[([^\]]*)\]\([^\)]*\)", r"\1", s)
+    s = re.sub(r"(^|\n)#+\s*", r"\1", s)
+    s = re.sub(r"[*_~]{1,3}", "", s)
+    s = re.sub(r"[-*]\s+", "", s)
+    s = re.sub(r"<[^>]+>", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def _ref_short_text(text: str, length: int = 240) -> str:
+    t = _ref_strip_md(text or "")
+    if len(t) <= length:
+        return t
+    cut = t[:length].rsplit(" ", 1)[0]
+    return cut + "…"
+
+
+def _ref_normalize_paragraphs(s: str) -> list[str]:
+    s = (s or "").replace("\r\n", "\n").replace("\r", "\n")
+    while "\n\n\n" in s:
+        s = s.replace("\n\n\n", "\n\n")
+    s = s.replace("\xa0", " ")
+    parts = [p.strip() for p in s.split("\n\n")]
+    return [p for p in parts if p and not all(ch in _BLANK_CHARS for ch in p)]
+
+
+_FRAGMENTS = [
+    "Session on sustainable tourism", "Панельная дискуссия", "旅游", "C# and .NET", "**bold** text", "__under__",
+    "~~gone~~", "*a*", "`code`", "```\nblock\n```", "[link](http://x)", "![img](a.png)", "[broken](", "# Head",
+    "### Sub", "#tag", "- item", "* star item", "a - b", "x-y", "<b>tag</b>", "1 < 2", "a > b", "—", "-", "...",
+    "•", "&amp;", "tab\there", "nbsp\xa0here", "\xa0", "\x1c", " ", "　", "\x85", " ", "  ",
+]
+_JOINERS = ["\n", "\n\n", "\n\n\n", "\r\n", "\r\n\r\n", "\r", " ", "", "\n \n", "\n\n\n\n\n"]
+
+
+def _corpus(n: int, seed: int = 11) -> list[str]:
+    rnd = random.Random(seed)
+    docs = ["", " ", "\n\n", "—\n\n-", "ok"]
+    for _ in range(n):
+        parts = []
+        for _ in range(rnd.randint(1, 12)):
+            parts.append(rnd.choice(_FRAGMENTS))
+            parts.append(rnd.choice(_JOINERS))
+        docs.append("".join(parts))
+    docs.append(" ".join(docs[5:60]))  # long enough for short_text to cut
+    return docs
+
+
+def _cold(func, docs: list[str]) -> None:
+    # time the computation, not the memo
+    text_utils.strip_markdown.cache_clear()
+    text_utils._paragraphs.cache_clear()
+    for d in docs:
+        func(d)
+
+
+def main() -> int:
+    docs = _corpus(20000)
+    mismatches = 0
+    for doc in docs:
+        for name, ref, new in (
+            ("strip_markdown", _ref_strip_md, strip_markdown),
+            ("short_text", _ref_short_text, short_text),
+            ("normalize_paragraphs", _ref_normalize_paragraphs, normalize_paragraphs),
+        ):
+            want, got = ref(doc), new(doc)
+            if want != got:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"MISMATCH {name} {doc!r}\n  want: {want!r}\n  got:  {got!r}")
+    print(f"documents: {len(docs)}  mismatches: {mismatches}")
+
+    sample = docs[:2000]
+    for name, ref, new in (
+        ("strip_markdown", _ref_strip_md, strip_markdown),
+        ("normalize_paragraphs", _ref_normalize_paragraphs, normalize_paragraphs),
+    ):
+        before = min(timeit.repeat(lambda: [ref(d) for d in sample], number=1, repeat=5)) / len(sample)
+        cold = min(timeit.repeat(lambda: _cold(new, sample), number=1, repeat=5)) / len(sample)
+        warm = min(timeit.repeat(lambda: [new(d) for d in sample], number=1, repeat=5)) / len(sample)
+        print(f"{name}: before {before * 1e6:.1f} µs, now {cold * 1e6:.1f} µs uncached, {warm * 1e6:.2f} µs repeated")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Memory held by cached projections: plain dicts (before) vs ViewModels (after).
+
+    python -m bench.view_model_memory
+
+Rows are synthetic but shaped like backend payloads. The per-worker figure
+assumes every (site, lang) cache slot is populated once, which is what a
+warm worker looks like after a crawl of the home, speakers and news pages.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from app.models.sponsor_model import Sponsor, SponsorTier
+from app.services import news, participants, speakers, sponsors
+
+SITES = 2
+LANGS = 4
+
+# cached items per (site, lang): speakers list + featured, participants home
+# list + first page, news page list + home list; sponsors are per site only
+POPULATION = {
+    "speakers": 40 + 3,
+    "participants": 200 + 12,
+    "news": 200 + 5,
+}
+SPONSORS_PER_SITE = 30
+
+
+def _speaker_row(i: int) -> dict:
+    return {
+        "id": i, "name": f"Name{i}", "surname": f"Surname{i}", "company": "Ministry of Tourism",
+        "position": "Deputy Minister", "description": "Speaker biography paragraph. " * 6,
+        "photo": f"speakers/{i}.jpg", "company_photo": f"companies/{i}.png", "website": "https://example.tm",
+        "email": f"s{i}@example.tm", "phone": "+993 12 000000", "social_links": [], "sessions": [{"id": i % 9}],
+    }
+
+
+def _participant_row(i: int) -> dict:
+    return {"id": i, "name": f"Participant company {i}", "role": "expo", "bio": "Company bio. " * 8, "logo": f"logos/{i}.png"}
+
+
+def _news_row(i: int) -> dict:
+    return {"id": i, "header": f"News headline number {i}", "description": "Summary sentence. " * 4,
+            "category": "News", "photo": f"news/{i}.jpg", "created_at": "2025-09-01T10:00:00"}
+
+
+def _sponsor(i: int) -> Sponsor:
+    return Sponsor(id=i, name=f"Sponsor {i}", website="example.tm", logo=f"sponsors/{i}.png", tier=SponsorTier.gold)
+
+
+def _measure(build) -> tuple[int, list]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, keep
+
+
+def _per_item(rows, project, as_dict: bool) -> float:
+    # project first so shared source strings are not counted, then measure
+    # only the container objects the cache would keep alive
+    views = [project(r) for r in rows]
+    if as_dict:
+        size, _ = _measure(lambda: [dict(v) for v in views])
+    else:
+        size, _ = _measure(lambda: [type(v)(**v.to_dict()) for v in views])
+    return size / len(rows)
+
+
+def main() -> None:
+    n = 500
+    kinds = {
+        "speakers": ([_speaker_row(i) for i in range(n)], speakers._row_to_dict),
+        "participants": ([_participant_row(i) for i in range(n)], participants._row_to_view),
+        "news": ([_news_row(i) for i in range(n)], news._row_to_card),
+        "sponsors": ([_sponsor(i) for i in range(n)], sponsors._project),
+    }
+
+    print(f"{'kind':<14}{'dict B/item':>12}{'view B/item':>12}")
+    totals = [0.0, 0.0]
+    for kind, (rows, project) in kinds.items():
+        d = _per_item(rows, project, as_dict=True)
+        v = _per_item(rows, project, as_dict=False)
+        print(f"{kind:<14}{d:>12.0f}{v:>12.0f}")
+        count = SPONSORS_PER_SITE * SITES if kind == "sponsors" else POPULATION[kind] * SITES * LANGS
+        totals[0] += d * count
+        totals[1] += v * count
+
+    print(f"\ncontainer bytes per warm worker ({SITES} sites x {LANGS} langs):")
+    print(f"  before (dict): {totals[0] / 1024:8.1f} KiB")
+    print(f"  after  (view): {totals[1] / 1024:8.1f} KiB  ({1 - totals[1] / totals[0]:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()